@@ -9,7 +9,9 @@ This template demonstrates:
 - Database initialization
 """
 
+from sqlalchemy import event
 from sqlmodel import SQLModel, create_engine, Session
+from functools import lru_cache
 from typing import Generator
 import os
 
@@ -21,22 +23,40 @@ DATABASE_URL = os.getenv(
 )
 
 # SQLite-specific connection args
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
 connect_args = {}
-if DATABASE_URL.startswith("sqlite"):
+if IS_SQLITE:
     connect_args = {"check_same_thread": False}
 
+# Pre-ping only helps with network databases; local SQLite files never go stale
+use_pre_ping = not IS_SQLITE
+
 # Create engine with connection pooling
 engine = create_engine(
     DATABASE_URL,
     echo=True,  # Log SQL queries (set to False in production)
     connect_args=connect_args,
     # Connection pool settings (PostgreSQL/MySQL)
-    pool_pre_ping=True,  # Verify connections before using
+    pool_pre_ping=use_pre_ping,  # Verify connections before using (not SQLite)
     pool_size=10,  # Number of connections to maintain
     max_overflow=20,  # Extra connections when pool is full
     pool_recycle=3600,  # Recycle connections after 1 hour
 )
 
+# SQLite performance pragmas (file databases only; WAL is meaningless for :memory:)
+if IS_SQLITE and ":memory:" not in DATABASE_URL:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Enable WAL so readers don't block on a writer, and relax fsyncs."""
+        cursor = dbapi_connection.cursor()
+        cursor.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA mmap_size=268435456;"
+        )
+        cursor.close()
+
 
 def create_db_and_tables():
     """
@@ -63,26 +83,60 @@ def get_session() -> Generator[Session, None, None]:
         yield session
 
 
+@lru_cache(maxsize=None)
+def user_by_email_statement():
+    """
+    Build the "user by email" query once and reuse it.
+
+    The email is a bind parameter, so the statement shape never changes
+    and SQLAlchemy's compiled-statement cache is hit on every call.
+    """
+    from models import User
+    from sqlalchemy import bindparam
+    from sqlmodel import select
+
+    return select(User).where(User.email == bindparam("email"))
+
+
 # Example: Using session directly (not in FastAPI)
 def example_usage():
     """Example of using session directly."""
     with Session(engine) as session:
         # Your database operations here
         from models import User
+        from sqlalchemy import insert
+
+        # Create: add_all + a single flush batches the INSERTs and
+        # populates primary keys without a refresh/SELECT per row
+        users = [
+            User(email="user@example.com", username="user", full_name="User Name"),
+            User(email="admin@example.com", username="admin", full_name="Admin User"),
+        ]
+        session.add_all(users)
+        session.flush()
+
+        # Bulk create: INSERT ... RETURNING hands back identifiers in the
+        # same roundtrip, no follow-up SELECT needed
+        new_users = [
+            User(email="alice@example.com", username="alice", full_name="Alice"),
+            User(email="bob@example.com", username="bob", full_name="Bob"),
+        ]
+        created = session.execute(
+            insert(User).returning(User.id, User.email),
+            [user.model_dump(exclude={"id"}) for user in new_users],
+        ).all()
 
-        # Create
-        user = User(email="user@example.com", username="user", full_name="User Name")
-        session.add(user)
         session.commit()
-        session.refresh(user)
-
-        # Read
-        from sqlmodel import select
 
-        statement = select(User).where(User.email == "user@example.com")
-        user = session.exec(statement).first()
+        # Read: reuse the cached statement, only the bind value changes
+        user = session.exec(
+            user_by_email_statement(),
+            params={"email": "user@example.com"},
+        ).first()
 
-        print(f"Created user: {user}")
+        print(f"Created users: {[user.id for user in users]}")
+        print(f"Bulk created: {created}")
+        print(f"Fetched user: {user}")
 
 
 # Alternative: PostgreSQL configuration
@@ -19,6 +19,19 @@ from alembic import context
 # Import SQLModel and all models
 from sqlmodel import SQLModel
 
+# Optional: Define naming conventions for constraints
+# This ensures consistent constraint names across databases.
+# Must be set BEFORE the models are imported, otherwise constraints
+# registered by the SQLModel metaclass won't pick up the convention.
+naming_convention = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s"
+}
+SQLModel.metadata.naming_convention = naming_convention
+
 # IMPORTANT: Import ALL your models here so Alembic can detect them
 # Add your model imports below:
 from models import (
@@ -42,17 +55,6 @@ if config.config_file_name is not None:
 # This allows Alembic to auto-generate migrations
 target_metadata = SQLModel.metadata
 
-# Optional: Define naming conventions for constraints
-# This ensures consistent constraint names across databases
-naming_convention = {
-    "ix": "ix_%(column_0_label)s",
-    "uq": "uq_%(table_name)s_%(column_0_name)s",
-    "ck": "ck_%(table_name)s_%(constraint_name)s",
-    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
-    "pk": "pk_%(table_name)s"
-}
-target_metadata.naming_convention = naming_convention
-
 
 def run_migrations_offline() -> None:
     """
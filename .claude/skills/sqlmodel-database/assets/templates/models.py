@@ -9,6 +9,7 @@ This template demonstrates:
 - Proper type hints and validation
 """
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List
 from datetime import datetime
@@ -18,6 +19,11 @@ from datetime import datetime
 class UserGroupLink(SQLModel, table=True):
     """Link table for User-Group many-to-many relationship."""
 
+    # Reverse-direction index so "users in group X" joins can use an index
+    __table_args__ = (
+        Index("ix_usergrouplink_group_user", "group_id", "user_id"),
+    )
+
     user_id: int = Field(foreign_key="user.id", primary_key=True)
     group_id: int = Field(foreign_key="group.id", primary_key=True)
 
@@ -31,13 +37,11 @@ class User(SQLModel, table=True):
     # Basic fields with constraints
     email: str = Field(
         unique=True,
-        index=True,
         max_length=255,
         description="User email address"
     )
     username: str = Field(
         unique=True,
-        index=True,
         min_length=3,
         max_length=100,
         description="Unique username"
@@ -53,11 +57,19 @@ class User(SQLModel, table=True):
     updated_at: Optional[datetime] = Field(default=None)
 
     # Relationships
-    posts: List["Post"] = Relationship(back_populates="user")
-    profile: Optional["UserProfile"] = Relationship(back_populates="user")
+    # Collections use selectin (one IN query), scalars use joined loading
+    posts: List["Post"] = Relationship(
+        back_populates="user",
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    profile: Optional["UserProfile"] = Relationship(
+        back_populates="user",
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
     groups: List["Group"] = Relationship(
         back_populates="users",
-        link_model=UserGroupLink
+        link_model=UserGroupLink,
+        sa_relationship_kwargs={"lazy": "selectin"}
     )
 
 
@@ -86,16 +98,21 @@ class UserProfile(SQLModel, table=True):
 class Post(SQLModel, table=True):
     """Post model with foreign key to User."""
 
+    # Composite index for "latest published posts by user" queries
+    __table_args__ = (
+        Index("ix_post_user_pub_created", "user_id", "is_published", "created_at"),
+    )
+
     # Primary key
     id: Optional[int] = Field(default=None, primary_key=True)
 
-    # Foreign key
-    user_id: int = Field(foreign_key="user.id", index=True)
+    # Foreign key (leading column of ix_post_user_pub_created)
+    user_id: int = Field(foreign_key="user.id")
 
     # Content fields
     title: str = Field(min_length=1, max_length=200)
     content: str = Field(min_length=1)
-    slug: str = Field(unique=True, index=True, max_length=250)
+    slug: str = Field(unique=True, max_length=250)
 
     # Status fields
     is_published: bool = Field(default=False)
@@ -107,13 +124,25 @@ class Post(SQLModel, table=True):
     published_at: Optional[datetime] = Field(default=None)
 
     # Relationships
-    user: Optional[User] = Relationship(back_populates="posts")
-    tags: List["Tag"] = Relationship(back_populates="posts", link_model="PostTagLink")
+    user: Optional[User] = Relationship(
+        back_populates="posts",
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
+    tags: List["Tag"] = Relationship(
+        back_populates="posts",
+        link_model="PostTagLink",
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class PostTagLink(SQLModel, table=True):
     """Link table for Post-Tag many-to-many relationship."""
 
+    # Reverse-direction index so "posts with tag X" joins can use an index
+    __table_args__ = (
+        Index("ix_posttaglink_tag_post", "tag_id", "post_id"),
+    )
+
     post_id: int = Field(foreign_key="post.id", primary_key=True)
     tag_id: int = Field(foreign_key="tag.id", primary_key=True)
 
@@ -125,14 +154,18 @@ class Tag(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # Fields
-    name: str = Field(unique=True, index=True, max_length=50)
-    slug: str = Field(unique=True, index=True, max_length=60)
+    name: str = Field(unique=True, max_length=50)
+    slug: str = Field(unique=True, max_length=60)
 
     # Audit fields
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     # Relationship
-    posts: List[Post] = Relationship(back_populates="tags", link_model=PostTagLink)
+    posts: List[Post] = Relationship(
+        back_populates="tags",
+        link_model=PostTagLink,
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class Group(SQLModel, table=True):
@@ -151,5 +184,6 @@ class Group(SQLModel, table=True):
     # Relationship
     users: List[User] = Relationship(
         back_populates="groups",
-        link_model=UserGroupLink
+        link_model=UserGroupLink,
+        sa_relationship_kwargs={"lazy": "selectin"}
     )
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Theme Bundle Builder Script
+
+Pre-parses all bundled theme configs into a single pickle next to the JSON
+files, so theme_generator.py can load every theme with one file read instead
+of parsing and transforming each JSON config.
+
+Also pre-renders every theme (with and without dark mode) into
+assets/prebuilt-themes/, so theme_generator.py only has to copy files.
+
+Both are ignored automatically once a JSON config or the generator changes
+(and the pre-rendered pages once the year changes); rerun this script to
+refresh them.
+
+Usage:
+    python build_themes_bundle.py
+    python build_themes_bundle.py --output /path/to/_bundle.pkl
+    python build_themes_bundle.py --no-prebuilt
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from theme_generator import (
+    THEME_CONFIG_MAP,
+    get_bundle_path,
+    get_prebuilt_root,
+    write_prebuilt_themes,
+    write_theme_bundle,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Prebuild the theme config bundle used by theme_generator.py"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help=f"Bundle file to write (default: {get_bundle_path()})"
+    )
+    parser.add_argument(
+        "--no-prebuilt",
+        action="store_true",
+        help=f"Skip pre-rendering theme outputs into {get_prebuilt_root()}"
+    )
+    args = parser.parse_args()
+
+    try:
+        bundle_path = write_theme_bundle(args.output)
+        prebuilt_root = None if args.no_prebuilt else write_prebuilt_themes()
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    except OSError as e:
+        print(f"❌ Error writing theme bundle: {e}")
+        print(f"   Solution: Check file permissions or choose a different --output path")
+        sys.exit(1)
+
+    print(f"✅ Bundled {len(THEME_CONFIG_MAP)} themes into {bundle_path}")
+    if prebuilt_root is not None:
+        print(f"✅ Pre-rendered {len(THEME_CONFIG_MAP) * 2} theme outputs into {prebuilt_root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -464,17 +464,21 @@ def main():
     filename = f"{args.component}-{args.variant}.html"
     output_file = output_dir / filename
 
+    # Title-case the names once for the page title and heading
+    comp_title = args.component.title()
+    var_title = args.variant.title()
+
     # Wrap in complete HTML
     complete_html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{args.component.title()} - {args.variant.title()}</title>
+  <title>{comp_title} - {var_title}</title>
   <link rel="stylesheet" href="../theme.css">
 </head>
 <body class="bg-background text-text p-8">
-  <h1 class="text-3xl font-bold mb-8">{args.component.title()} - {args.variant.title()}</h1>
+  <h1 class="text-3xl font-bold mb-8">{comp_title} - {var_title}</h1>
 
   <!-- Component -->
   {component_html}
@@ -13,29 +13,37 @@ Usage:
 
 import argparse
 import json
-import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Tuple, Optional, TextIO
 
+# Palettes are kept as (hue, saturation, lightness) integer tuples and only
+# rendered to "H S% L%" strings when CSS/HTML/JSON is emitted
+HSL = Tuple[int, int, int]
 
-def validate_hsl_color(hsl_string: str) -> bool:
+# Single shared template for every emitted color
+_HSL_FMT = "%d %d%% %d%%"
+
+
+def _fmt_hsl(color: HSL) -> str:
+    """Render an (h, s, l) tuple as an "H S% L%" string."""
+    return _HSL_FMT % color
+
+
+def validate_hsl_values(h: int, s: int, l: int) -> bool:
     """
-    Validate HSL color format to prevent injection.
+    Validate HSL component ranges.
 
     Args:
-        hsl_string: HSL color in format "H S% L%" (e.g., "220 90% 56%")
+        h: Hue (0-360)
+        s: Saturation percentage (0-100)
+        l: Lightness percentage (0-100)
 
     Returns:
         True if valid, raises ValueError otherwise.
     """
-    pattern = r'^\d{1,3}\s+\d{1,3}%\s+\d{1,3}%$'
-    if not re.match(pattern, hsl_string):
-        raise ValueError(f"Invalid HSL format: '{hsl_string}'. Expected format: 'H S% L%'")
-
-    parts = hsl_string.replace('%', '').split()
-    h, s, l = int(parts[0]), int(parts[1]), int(parts[2])
-
     if not (0 <= h <= 360):
         raise ValueError(f"Hue value {h} out of range (0-360)")
     if not (0 <= s <= 100):
@@ -46,20 +54,47 @@ def validate_hsl_color(hsl_string: str) -> bool:
     return True
 
 
-def safe_write_file(file_path: Path, content: str, description: str) -> bool:
+def validate_hsl_color(hsl_string: str) -> bool:
     """
-    Safely write content to a file with error handling.
+    Validate HSL color format to prevent injection.
+
+    Args:
+        hsl_string: HSL color in format "H S% L%" (e.g., "220 90% 56%")
+
+    Returns:
+        True if valid, raises ValueError otherwise.
+    """
+    # Cheap structural check first; only well-shaped strings get parsed
+    if not hsl_string or not hsl_string[0].isdigit() or hsl_string.count('%') != 2:
+        raise ValueError(f"Invalid HSL format: '{hsl_string}'. Expected format: 'H S% L%'")
+
+    # Fixed "H S% L%" grammar: split on whitespace, strip the '%' suffixes
+    parts = hsl_string.split()
+    if len(parts) != 3 or hsl_string[-1] != '%' or not parts[1].endswith('%'):
+        raise ValueError(f"Invalid HSL format: '{hsl_string}'. Expected format: 'H S% L%'")
+
+    digits = (parts[0], parts[1][:-1], parts[2][:-1])
+    if not all(0 < len(d) <= 3 and d.isdecimal() for d in digits):
+        raise ValueError(f"Invalid HSL format: '{hsl_string}'. Expected format: 'H S% L%'")
+
+    return validate_hsl_values(int(digits[0]), int(digits[1]), int(digits[2]))
+
+
+def _safe_write(file_path: Path, description: str, writer: Callable[[TextIO], None]) -> bool:
+    """
+    Open a file for writing and hand it to writer, with error handling.
 
     Args:
         file_path: Path to write to
-        content: Content to write
-        description: Description for error messages
+        description: Description for messages
+        writer: Callable that writes the content to the open file
 
     Returns:
         True if successful, exits on failure.
     """
     try:
-        file_path.write_text(content)
+        with file_path.open("w") as f:
+            writer(f)
         print(f"✅ Created {description}")
         return True
     except PermissionError:
@@ -72,6 +107,51 @@ def safe_write_file(file_path: Path, content: str, description: str) -> bool:
         sys.exit(1)
 
 
+def safe_write_file(file_path: Path, content: str, description: str) -> bool:
+    """
+    Safely write content to a file with error handling.
+
+    Args:
+        file_path: Path to write to
+        content: Content to write
+        description: Description for error messages
+
+    Returns:
+        True if successful, exits on failure.
+    """
+    return _safe_write(file_path, description, lambda f: f.write(content))
+
+
+def safe_write_chunks(file_path: Path, chunks: Iterable[str], description: str) -> bool:
+    """
+    Stream string chunks to a file without joining them in memory first.
+
+    Args:
+        file_path: Path to write to
+        chunks: Iterable of strings to write in order
+        description: Description for error messages
+
+    Returns:
+        True if successful, exits on failure.
+    """
+    return _safe_write(file_path, description, lambda f: f.writelines(chunks))
+
+
+def safe_write_json(file_path: Path, obj: Dict, description: str) -> bool:
+    """
+    Serialize obj as indented JSON straight into a file.
+
+    Args:
+        file_path: Path to write to
+        obj: JSON-serializable object
+        description: Description for error messages
+
+    Returns:
+        True if successful, exits on failure.
+    """
+    return _safe_write(file_path, description, lambda f: json.dump(obj, f, indent=2))
+
+
 def safe_create_directory(dir_path: Path) -> bool:
     """
     Safely create a directory with error handling.
@@ -107,57 +187,117 @@ PRESETS = {
 }
 
 
-def generate_color_scale(hue: int, saturation: int) -> Dict[str, str]:
-    """Generate a color scale from 50 to 950 with given hue and saturation."""
-
-    # Lightness values for each step
-    lightness_values = {
-        50: 97,
-        100: 93,
-        200: 87,
-        300: 78,
-        400: 68,
-        500: 60,  # Base color
-        600: 53,
-        700: 48,
-        800: 40,
-        900: 33,
-        950: 21
-    }
+# Lightness values for each scale step
+SCALE_LIGHTNESS = {
+    50: 97,
+    100: 93,
+    200: 87,
+    300: 78,
+    400: 68,
+    500: 60,  # Base color
+    600: 53,
+    700: 48,
+    800: 40,
+    900: 33,
+    950: 21
+}
+
+# Saturation bands: very light steps are desaturated, very dark steps slightly reduced
+_SAT_NORMAL, _SAT_LIGHT, _SAT_DARK = 0, 1, 2
+
+# Per-step lookup table: (step key, saturation band, lightness)
+_SCALE_STEPS = tuple(
+    (
+        str(step),
+        _SAT_LIGHT if lightness > 90 else _SAT_DARK if lightness < 30 else _SAT_NORMAL,
+        lightness,
+    )
+    for step, lightness in SCALE_LIGHTNESS.items()
+)
+
+
+def _color_scale_components(hue: int, saturation: int) -> Tuple[HSL, ...]:
+    """Numeric core of generate_color_scale: one (h, s, l) tuple per step."""
+
+    # Only three saturations are possible, indexed by band
+    saturations = (
+        saturation,
+        min(saturation, 20),  # Reduce saturation for very light
+        max(saturation - 10, 10),  # Slightly reduce for very dark
+    )
 
-    scale = {}
-    for step, lightness in lightness_values.items():
-        # Adjust saturation for very light and very dark colors
-        adjusted_sat = saturation
-        if lightness > 90:
-            adjusted_sat = min(saturation, 20)  # Reduce saturation for very light
-        elif lightness < 30:
-            adjusted_sat = max(saturation - 10, 10)  # Slightly reduce for very dark
+    return tuple((hue, saturations[band], lightness) for _, band, lightness in _SCALE_STEPS)
 
-        scale[str(step)] = f"{hue} {adjusted_sat}% {lightness}%"
 
-    return scale
+@lru_cache(maxsize=512)
+def generate_color_scale(hue: int, saturation: int) -> Mapping[str, str]:
+    """
+    Generate a color scale from 50 to 950 with given hue and saturation.
+
+    Results are memoized, so a read-only mapping is returned; use
+    dict(...) if you need to modify it.
+    """
+
+    components = _color_scale_components(hue, saturation)
+
+    return MappingProxyType({
+        step: _HSL_FMT % color
+        for (step, _, _), color in zip(_SCALE_STEPS, components)
+    })
+
 
+# sRGB channel (0-255) -> linear light, precomputed per WCAG 2.x
+_SRGB_LIN = tuple(
+    ((v / 255 + 0.055) / 1.055) ** 2.4 if v > 10 else v / 255 / 12.92
+    for v in range(256)
+)
 
-def calculate_contrast_ratio(l1: float, l2: float) -> float:
+
+def _hsl_to_rgb(h: int, s: int, l: int) -> Tuple[int, int, int]:
     """
-    Calculate contrast ratio between two relative luminance values.
-    Simplified calculation for HSL colors.
+    Convert HSL (0-360, 0-100, 0-100) to sRGB channels (0-255).
+
+    Uses the branchless form f(n) = L - a * max(-1, min(k - 3, 9 - k, 1))
+    with k = (n + H / 30) mod 12 and a = S * min(L, 1 - L).
     """
-    # Approximate relative luminance from lightness
-    # This is simplified; proper calculation requires RGB conversion
-    lighter = max(l1, l2) / 100
-    darker = min(l1, l2) / 100
+    s_f = s / 100
+    l_f = l / 100
+    a = s_f * min(l_f, 1 - l_f)
+    h_30 = h / 30
+
+    def channel(n: int) -> int:
+        k = (n + h_30) % 12
+        return round((l_f - a * max(-1, min(k - 3, 9 - k, 1))) * 255)
+
+    return channel(0), channel(8), channel(4)
+
+
+def _relative_luminance(r: int, g: int, b: int) -> float:
+    """WCAG relative luminance of an sRGB color (channels 0-255)."""
+    return 0.2126 * _SRGB_LIN[r] + 0.7152 * _SRGB_LIN[g] + 0.0722 * _SRGB_LIN[b]
+
+
+def calculate_contrast_ratio(color1: HSL, color2: HSL) -> float:
+    """
+    Calculate the WCAG contrast ratio between two HSL colors.
+
+    Colors are converted to sRGB and compared by relative luminance,
+    so hue and saturation are taken into account, not just lightness.
+    """
+    lum1 = _relative_luminance(*_hsl_to_rgb(*color1))
+    lum2 = _relative_luminance(*_hsl_to_rgb(*color2))
+    lighter = max(lum1, lum2)
+    darker = min(lum1, lum2)
 
     # Add 0.05 to avoid division by zero
     ratio = (lighter + 0.05) / (darker + 0.05)
     return ratio
 
 
-def check_accessibility(bg_lightness: int, text_lightness: int, is_large_text: bool = False) -> Dict:
+def check_accessibility(background: HSL, text: HSL, is_large_text: bool = False) -> Dict:
     """Check if color combination meets WCAG standards."""
 
-    ratio = calculate_contrast_ratio(bg_lightness, text_lightness)
+    ratio = calculate_contrast_ratio(background, text)
     aa_threshold = 3.0 if is_large_text else 4.5
     aaa_threshold = 4.5 if is_large_text else 7.0
 
@@ -170,112 +310,120 @@ def check_accessibility(bg_lightness: int, text_lightness: int, is_large_text: b
     }
 
 
-def generate_semantic_colors(hue: int, saturation: int, dark_mode: bool = False) -> Dict[str, str]:
-    """Generate semantic color palette (primary, secondary, accent, etc.)."""
+# Hue offsets of the secondary and accent colors from the primary hue
+_SECONDARY_HUE_OFFSET = 40
+_ACCENT_HUE_OFFSET = 80
+
+
+@lru_cache(maxsize=512)
+def generate_semantic_colors(hue: int, saturation: int, dark_mode: bool = False) -> Mapping[str, HSL]:
+    """
+    Generate semantic color palette (primary, secondary, accent, etc.).
+
+    Colors are (h, s, l) tuples. Results are memoized per
+    (hue, saturation, dark_mode) and returned as a read-only mapping, so
+    one palette can be shared by the CSS, HTML and JSON emitters without
+    defensive copies; use dict(...) if you need to modify it.
+    """
+
+    secondary_hue = (hue + _SECONDARY_HUE_OFFSET) % 360
+    accent_hue = (hue + _ACCENT_HUE_OFFSET) % 360
 
     if dark_mode:
-        return {
-            "primary": f"{hue} {saturation}% 60%",
-            "secondary": f"{(hue + 40) % 360} {saturation}% 65%",
-            "accent": f"{(hue + 80) % 360} {saturation}% 70%",
-            "background": f"{hue} 20% 10%",
-            "surface": f"{hue} 18% 15%",
-            "text": "0 0% 95%",
-            "text-muted": "0 0% 60%",
-            "success": "142 71% 55%",
-            "warning": "38 92% 60%",
-            "error": "0 84% 65%",
-            "info": "199 89% 60%"
-        }
+        return MappingProxyType({
+            "primary": (hue, saturation, 60),
+            "secondary": (secondary_hue, saturation, 65),
+            "accent": (accent_hue, saturation, 70),
+            "background": (hue, 20, 10),
+            "surface": (hue, 18, 15),
+            "text": (0, 0, 95),
+            "text-muted": (0, 0, 60),
+            "success": (142, 71, 55),
+            "warning": (38, 92, 60),
+            "error": (0, 84, 65),
+            "info": (199, 89, 60)
+        })
     else:
-        return {
-            "primary": f"{hue} {saturation}% 56%",
-            "secondary": f"{(hue + 40) % 360} {max(saturation - 20, 30)}% 60%",
-            "accent": f"{(hue + 80) % 360} {saturation}% 58%",
-            "background": "0 0% 100%",
-            "surface": "0 0% 98%",
-            "text": "0 0% 10%",
-            "text-muted": "0 0% 45%",
-            "success": "142 71% 45%",
-            "warning": "38 92% 50%",
-            "error": "0 84% 60%",
-            "info": "199 89% 48%"
-        }
+        return MappingProxyType({
+            "primary": (hue, saturation, 56),
+            "secondary": (secondary_hue, max(saturation - 20, 30), 60),
+            "accent": (accent_hue, saturation, 58),
+            "background": (0, 0, 100),
+            "surface": (0, 0, 98),
+            "text": (0, 0, 10),
+            "text-muted": (0, 0, 45),
+            "success": (142, 71, 45),
+            "warning": (38, 92, 50),
+            "error": (0, 84, 60),
+            "info": (199, 89, 48)
+        })
+
+
+def _dark_background_lightness(l_val: int) -> int:
+    """Make backgrounds dark."""
+    new_l = 100 - l_val
+    if new_l > 90:
+        new_l = 10 + (90 - l_val) // 2
+    return new_l
+
+
+def _dark_text_lightness(l_val: int) -> int:
+    """Make text light."""
+    new_l = 100 - l_val
+    if new_l < 60:
+        new_l = 60 + (l_val - 10) // 2
+    return new_l
+
+
+def _dark_other_lightness(l_val: int) -> int:
+    """Adjust other colors slightly."""
+    return max(min(l_val + 10, 70), 50)
+
+
+# Dark-mode lightness rule per semantic color name (default: _dark_other_lightness)
+_DARK_LIGHTNESS_RULES = {
+    "background": _dark_background_lightness,
+    "surface": _dark_background_lightness,
+    "text": _dark_text_lightness,
+    "text-muted": _dark_text_lightness,
+}
 
 
-def generate_dark_mode_variant(light_colors: Dict[str, str]) -> Dict[str, str]:
+def generate_dark_mode_variant(light_colors: Mapping[str, HSL]) -> Dict[str, HSL]:
     """Generate dark mode variant of a light color palette."""
 
     dark_colors = {}
 
-    for name, hsl in light_colors.items():
-        parts = hsl.split()
-        if len(parts) == 3:
-            h, s, l = parts
-            h_val = int(h)
-            s_val = int(s.rstrip('%'))
-            l_val = int(l.rstrip('%'))
-
-            # Invert lightness for dark mode
-            if name in ["background", "surface"]:
-                # Make backgrounds dark
-                new_l = 100 - l_val
-                if new_l > 90:
-                    new_l = 10 + (90 - l_val) // 2
-            elif name in ["text", "text-muted"]:
-                # Make text light
-                new_l = 100 - l_val
-                if new_l < 60:
-                    new_l = 60 + (l_val - 10) // 2
-            else:
-                # Adjust other colors slightly
-                new_l = max(min(l_val + 10, 70), 50)
-
-            dark_colors[name] = f"{h_val} {s_val}% {new_l}%"
+    for name, (h_val, s_val, l_val) in light_colors.items():
+        # Invert lightness for dark mode
+        new_l = _DARK_LIGHTNESS_RULES.get(name, _dark_other_lightness)(l_val)
+
+        dark_colors[name] = (h_val, s_val, new_l)
 
     return dark_colors
 
 
-def generate_css(palette: Dict[str, str], dark_palette: Dict[str, str] = None) -> str:
-    """Generate CSS with @theme directive."""
-
-    css = """@import "tailwindcss";
+# Static scaffolding, built once at import
+_CSS_PREAMBLE = """@import "tailwindcss";
 
 @theme {
   /* Semantic Colors */
 """
 
-    for name, value in palette.items():
-        css += f"  --color-{name}: {value};\n"
-
-    css += "}\n"
-
-    if dark_palette:
-        css += """
+_CSS_DARK_MEDIA_OPEN = """
 /* Dark Mode */
 @media (prefers-color-scheme: dark) {
   @theme {
 """
-        for name, value in dark_palette.items():
-            css += f"    --color-{name}: {value};\n"
 
-        css += """  }
+_CSS_DARK_MEDIA_CLOSE = """  }
 }
 
 .dark {
 """
-        for name, value in dark_palette.items():
-            css += f"  --color-{name}: {value};\n"
-
-        css += "}\n"
 
-    return css
-
-
-def generate_preview_html(palette: Dict[str, str], name: str, dark_palette: Dict[str, str] = None) -> str:
-    """Generate HTML preview of the palette."""
-
-    html = f"""<!DOCTYPE html>
+# Preview page <head> and heading; the only placeholder is {name}
+_HTML_HEAD_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
@@ -350,56 +498,25 @@ def generate_preview_html(palette: Dict[str, str], name: str, dark_palette: Dict
     <h1>{name}</h1>
 """
 
-    if dark_palette:
-        html += """
+_HTML_MODE_TOGGLE = """
     <div class="mode-toggle">
       <button class="active" onclick="showLightMode()">Light Mode</button>
       <button onclick="showDarkMode()">Dark Mode</button>
     </div>
 """
 
-    html += """
-    <div class="palette light-mode">
-"""
-
-    # Light mode colors
-    for color_name, color_value in palette.items():
-        hsl_parts = color_value.split()
-        if len(hsl_parts) == 3:
-            html += f"""
+# One color card in the preview grid
+_SWATCH_TMPL = """
       <div class="color">
-        <div class="color-swatch" style="background: hsl({color_value});"></div>
+        <div class="color-swatch" style="background: hsl({value});"></div>
         <div class="color-info">
-          <div class="color-name">{color_name}</div>
-          <div class="color-value">hsl({color_value})</div>
+          <div class="color-name">{name}</div>
+          <div class="color-value">hsl({value})</div>
         </div>
       </div>
 """
 
-    html += """
-    </div>
-"""
-
-    # Dark mode colors
-    if dark_palette:
-        html += """
-    <div class="palette dark-mode" style="display: none;">
-"""
-        for color_name, color_value in dark_palette.items():
-            html += f"""
-      <div class="color">
-        <div class="color-swatch" style="background: hsl({color_value});"></div>
-        <div class="color-info">
-          <div class="color-name">{color_name}</div>
-          <div class="color-value">hsl({color_value})</div>
-        </div>
-      </div>
-"""
-        html += """
-    </div>
-"""
-
-    html += """
+_HTML_SCRIPT = """
   </div>
 
   <script>
@@ -421,7 +538,74 @@ def generate_preview_html(palette: Dict[str, str], name: str, dark_palette: Dict
 </html>
 """
 
-    return html
+
+def iter_css(palette: Mapping[str, HSL], dark_palette: Mapping[str, HSL] = None) -> Iterator[str]:
+    """Yield the palette CSS in chunks (see generate_css)."""
+
+    yield _CSS_PREAMBLE
+
+    yield from (f"  --color-{name}: {_fmt_hsl(value)};\n" for name, value in palette.items())
+
+    yield "}\n"
+
+    if dark_palette:
+        yield _CSS_DARK_MEDIA_OPEN
+        yield from (f"    --color-{name}: {_fmt_hsl(value)};\n" for name, value in dark_palette.items())
+
+        yield _CSS_DARK_MEDIA_CLOSE
+        yield from (f"  --color-{name}: {_fmt_hsl(value)};\n" for name, value in dark_palette.items())
+
+        yield "}\n"
+
+
+def generate_css(palette: Mapping[str, HSL], dark_palette: Mapping[str, HSL] = None) -> str:
+    """Generate CSS with @theme directive."""
+    return "".join(iter_css(palette, dark_palette))
+
+
+def _render_swatches(palette: Mapping[str, HSL]) -> str:
+    """Render one swatch card per palette color."""
+    return "".join(
+        _SWATCH_TMPL.format(name=name, value=_fmt_hsl(color))
+        for name, color in palette.items()
+    )
+
+
+def iter_preview_html(palette: Mapping[str, HSL], name: str, dark_palette: Mapping[str, HSL] = None) -> Iterator[str]:
+    """Yield the palette preview HTML in chunks (see generate_preview_html)."""
+
+    yield _HTML_HEAD_TEMPLATE.format(name=name)
+
+    if dark_palette:
+        yield _HTML_MODE_TOGGLE
+
+    yield """
+    <div class="palette light-mode">
+"""
+
+    # Light mode colors
+    yield _render_swatches(palette)
+
+    yield """
+    </div>
+"""
+
+    # Dark mode colors
+    if dark_palette:
+        yield """
+    <div class="palette dark-mode" style="display: none;">
+"""
+        yield _render_swatches(dark_palette)
+        yield """
+    </div>
+"""
+
+    yield _HTML_SCRIPT
+
+
+def generate_preview_html(palette: Mapping[str, HSL], name: str, dark_palette: Mapping[str, HSL] = None) -> str:
+    """Generate HTML preview of the palette."""
+    return "".join(iter_preview_html(palette, name, dark_palette))
 
 
 def main():
@@ -510,21 +694,11 @@ def main():
     light_palette = generate_semantic_colors(hue, saturation, dark_mode=False)
     dark_palette = generate_semantic_colors(hue, saturation, dark_mode=True) if args.dark_mode else None
 
-    # Validate generated colors
-    try:
-        for name, color in light_palette.items():
-            validate_hsl_color(color)
-        if dark_palette:
-            for name, color in dark_palette.items():
-                validate_hsl_color(color)
-    except ValueError as e:
-        print(f"❌ Error: Generated invalid color - {e}")
-        sys.exit(1)
+    # No re-validation of generated colors: they are built from the
+    # range-checked hue/saturation above and fixed in-range constants
 
     # Check accessibility
-    bg_lightness = 100
-    text_lightness = 10
-    contrast_check = check_accessibility(bg_lightness, text_lightness)
+    contrast_check = check_accessibility(light_palette["background"], light_palette["text"])
 
     print(f"\n✅ Accessibility Check:")
     print(f"   Contrast Ratio: {contrast_check['ratio']}:1")
@@ -538,20 +712,20 @@ def main():
             "name": palette_name,
             "hue": hue,
             "saturation": saturation,
-            "light": light_palette
+            "light": {name: _fmt_hsl(color) for name, color in light_palette.items()}
         }
         if dark_palette:
-            palette_json["dark"] = dark_palette
+            palette_json["dark"] = {name: _fmt_hsl(color) for name, color in dark_palette.items()}
 
-        safe_write_file(output_dir / "palette.json", json.dumps(palette_json, indent=2), "palette.json")
+        safe_write_json(output_dir / "palette.json", palette_json, "palette.json")
 
         # 2. palette.css
-        palette_css = generate_css(light_palette, dark_palette)
-        safe_write_file(output_dir / "palette.css", palette_css, "palette.css")
+        palette_css = iter_css(light_palette, dark_palette)
+        safe_write_chunks(output_dir / "palette.css", palette_css, "palette.css")
 
         # 3. preview.html
-        preview_html = generate_preview_html(light_palette, palette_name, dark_palette)
-        safe_write_file(output_dir / "preview.html", preview_html, "preview.html")
+        preview_html = iter_preview_html(light_palette, palette_name, dark_palette)
+        safe_write_chunks(output_dir / "preview.html", preview_html, "preview.html")
 
         print(f"\n✨ Palette generated successfully in: {output_dir.absolute()}")
         print(f"\n📝 Next steps:")
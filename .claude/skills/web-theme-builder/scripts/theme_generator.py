@@ -11,14 +11,54 @@ Usage:
     python theme_generator.py --list  # List available themes
 """
 
-import argparse
-from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache
 import json
 import os
-import re
+import pickle
+import shutil
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+# orjson is optional: it is much faster, but the standard library works too
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# aiofiles is optional: output files are written with asyncio when it is
+# installed, and from a thread pool otherwise
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_indent(obj: Any) -> str:
+    """Encode obj as 2-space indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_indent_bytes(obj: Any) -> bytes:
+    """Like _dumps_indent, but UTF-8 bytes ready to write (no decode with orjson)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
 
 
 def validate_hsl_color(hsl_string: str) -> bool:
@@ -31,19 +71,23 @@ def validate_hsl_color(hsl_string: str) -> bool:
     Returns:
         True if valid, raises ValueError otherwise.
     """
-    pattern = r'^\d{1,3}\s+\d{1,3}%\s+\d{1,3}%$'
-    if not re.match(pattern, hsl_string):
+    # Fixed "H S% L%" grammar: split on whitespace, strip the '%' suffixes
+    parts = hsl_string.split()
+    if (len(parts) != 3 or not hsl_string[0].isdigit() or hsl_string[-1] != '%'
+            or not parts[1].endswith('%')):
         raise ValueError(f"Invalid HSL format: '{hsl_string}'. Expected format: 'H S% L%'")
 
-    parts = hsl_string.replace('%', '').split()
-    h, s, l = int(parts[0]), int(parts[1]), int(parts[2])
+    digits = (parts[0], parts[1][:-1], parts[2][:-1])
+    if not all(0 < len(d) <= 3 and d.isdecimal() for d in digits):
+        raise ValueError(f"Invalid HSL format: '{hsl_string}'. Expected format: 'H S% L%'")
+
+    h, s, l = map(int, digits)
 
-    if not (0 <= h <= 360):
-        raise ValueError(f"Hue value {h} out of range (0-360)")
-    if not (0 <= s <= 100):
-        raise ValueError(f"Saturation value {s} out of range (0-100)")
-    if not (0 <= l <= 100):
-        raise ValueError(f"Lightness value {l} out of range (0-100)")
+    # Only digits get this far, so values are never negative:
+    # only the upper bounds need checking
+    for value, upper, label in ((h, 360, "Hue"), (s, 100, "Saturation"), (l, 100, "Lightness")):
+        if value > upper:
+            raise ValueError(f"{label} value {value} out of range (0-{upper})")
 
     return True
 
@@ -73,52 +117,158 @@ def validate_theme_config(theme_config: Dict[str, Any]) -> bool:
     return True
 
 
-def safe_write_file(file_path: Path, content: str, description: str) -> bool:
-    """
-    Safely write content to a file with error handling.
+# Output files are independent, so they are written concurrently
+_WRITE_WORKERS = 4
 
-    Args:
-        file_path: Path to write to
-        content: Content to write
-        description: Description for error messages
 
-    Returns:
-        True if successful, exits on failure.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+# Output content is str (encoded as UTF-8) or already-encoded bytes
+Chunk = Union[str, bytes]
+
+
+def _as_bytes(chunk: Chunk) -> bytes:
+    return chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def _fast_write(path: Path, chunks: Iterable[Chunk]) -> None:
+    """
+    Stream text/bytes chunks to a file without joining them first.
+
+    The fd comes straight from os.open; the buffered writer on top of it
+    coalesces the chunks so small files still go out in a single write(2).
     """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
     try:
-        file_path.write_text(content)
-        print(f"✅ Created {description}")
-        return True
-    except PermissionError:
-        print(f"❌ Error: No write permission for {file_path}")
-        print(f"   Solution: Check file permissions or choose different output directory")
-        sys.exit(1)
+        fh = os.fdopen(fd, "wb")
+    except BaseException:
+        os.close(fd)
+        raise
+    with fh:
+        fh.writelines(map(_as_bytes, chunks))
+
+
+class ThemeGenError(Exception):
+    """A theme generation step failed; main() reports it and exits."""
+
+    def __init__(self, message: str, solution: Optional[str] = None):
+        super().__init__(message)
+        self.solution = solution
+
+
+class OutputWriteError(ThemeGenError):
+    """Raised when an output file cannot be written."""
+
+
+# (path, content chunks, description) for one output file
+WriteTask = Tuple[Path, Iterable[Chunk], str]
+
+
+@contextmanager
+def _output_write_errors(file_path: Path, description: str) -> Iterator[None]:
+    """Translate OS errors raised while writing file_path into OutputWriteError."""
+    try:
+        yield
+    except PermissionError as e:
+        raise OutputWriteError(
+            f"Error: No write permission for {file_path}",
+            "Check file permissions or choose different output directory",
+        ) from e
     except OSError as e:
-        print(f"❌ Error writing {description}: {e}")
-        print(f"   Solution: Check disk space and file system permissions")
-        sys.exit(1)
+        raise OutputWriteError(
+            f"Error writing {description}: {e}",
+            "Check disk space and file system permissions",
+        ) from e
+
+
+def write_output_file(file_path: Path, content: Union[Chunk, Iterable[Chunk]],
+                      description: str) -> Path:
+    """
+    Write content (str, bytes, or an iterable of either) to a file, raising
+    OutputWriteError on failure.
+
+    Safe to call from worker threads: it neither prints nor exits.
+
+    Returns:
+        The path that was written.
+    """
+    with _output_write_errors(file_path, description):
+        _fast_write(file_path, (content,) if isinstance(content, (str, bytes)) else content)
+    return file_path
+
+
+async def _write_one(file_path: Path, content: Union[Chunk, Iterable[Chunk]],
+                     description: str) -> Path:
+    """Async counterpart of write_output_file, using aiofiles."""
+    if isinstance(content, (str, bytes)):
+        content = (content,)
+    with _output_write_errors(file_path, description):
+        async with aiofiles.open(file_path, "wb") as fh:
+            await fh.writelines(map(_as_bytes, content))
+    return file_path
+
+
+async def _write_all(tasks: Sequence[WriteTask]) -> List[Any]:
+    """Write every task at once; results (paths or exceptions) are in task order."""
+    import asyncio
+
+    return await asyncio.gather(*(_write_one(*task) for task in tasks), return_exceptions=True)
+
 
+def _write_files_async(tasks: Sequence[WriteTask]) -> Iterator[Path]:
+    # Imported here: asyncio is slow to import and only needed with aiofiles
+    import asyncio
 
-def safe_create_directory(dir_path: Path) -> bool:
+    for result in asyncio.run(_write_all(tasks)):
+        if isinstance(result, BaseException):
+            raise result
+        yield result
+
+
+def _write_files_threaded(tasks: Sequence[WriteTask]) -> Iterator[Path]:
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+        # map() yields in submission order and re-raises worker errors
+        yield from executor.map(lambda task: write_output_file(*task), tasks)
+
+
+def write_output_files(tasks: Sequence[WriteTask]) -> Iterator[Path]:
+    """
+    Write several output files concurrently.
+
+    Yields the written paths in task order; the first failing task (in that
+    order) raises OutputWriteError.
+    """
+    if aiofiles is not None:
+        return _write_files_async(tasks)
+    return _write_files_threaded(tasks)
+
+
+def safe_create_directory(dir_path: Path) -> None:
     """
     Safely create a directory with error handling.
 
     Args:
         dir_path: Path to create
 
-    Returns:
-        True if successful, exits on failure.
+    Raises:
+        ThemeGenError: If the directory cannot be created
     """
     try:
         dir_path.mkdir(parents=True, exist_ok=True)
-        return True
-    except PermissionError:
-        print(f"❌ Error: No permission to create directory {dir_path}")
-        print(f"   Solution: Check directory permissions or choose different location")
-        sys.exit(1)
+    except PermissionError as e:
+        raise ThemeGenError(
+            f"Error: No permission to create directory {dir_path}",
+            "Check directory permissions or choose different location",
+        ) from e
     except OSError as e:
-        print(f"❌ Error creating directory {dir_path}: {e}")
-        sys.exit(1)
+        raise ThemeGenError(f"Error creating directory {dir_path}: {e}") from e
+
+
+def _print_error(error: ThemeGenError) -> None:
+    print(f"❌ {error}")
+    if error.solution:
+        print(f"   Solution: {error.solution}")
 
 
 # Theme name mapping to JSON config files
@@ -134,21 +284,93 @@ THEME_CONFIG_MAP = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Get the path to the theme-configs directory."""
-    script_dir = Path(__file__).parent
+    """Get the path to the theme-configs directory (resolved once per process)."""
+    script_dir = Path(__file__).resolve().parent
     return script_dir.parent / "assets" / "theme-configs"
 
 
-def load_theme_config(theme_key: str) -> Dict[str, Any]:
+def get_cache_dir() -> Optional[Path]:
     """
-    Load theme configuration from JSON file.
+    Get the per-user cache directory for parsed theme configs.
+
+    Returns None (cache disabled) when no home directory can be determined,
+    e.g. in containers without HOME or a passwd entry.
+    """
+    try:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    except (RuntimeError, KeyError, OSError):
+        return None
+    return Path(base) / "tmaskills" / "theme-configs"
+
+
+def _atomic_pickle(path: Path, obj: Any) -> None:
+    """
+    Pickle obj to path via a uniquely named temp file in the same directory.
+
+    Concurrent writers each get their own temp file, so the final os.replace
+    never publishes a file two processes wrote into at once.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp", delete=False
+    ) as f:
+        tmp_file = Path(f.name)
+        try:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            f.close()
+            tmp_file.unlink(missing_ok=True)
+            raise
+    try:
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _read_cached_entry(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Return a cached theme entry, or None if missing or unreadable.
+
+    Entries look like {"config": transformed_config, "validated": bool}.
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            entry = pickle.load(f)
+    except Exception:
+        # Missing, truncated or incompatible cache entries just mean a re-parse
+        return None
+    if not isinstance(entry, dict) or "config" not in entry:
+        return None
+    return entry
+
+
+def _write_cached_entry(cache_file: Path, theme_key: str, entry: Dict[str, Any]) -> None:
+    """Store a theme entry in the cache; failures are ignored."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Drop entries for older versions of the same config file
+        # (another run may be pruning the same files)
+        for stale in cache_file.parent.glob(f"{theme_key}-*.pkl"):
+            stale.unlink(missing_ok=True)
+        _atomic_pickle(cache_file, entry)
+    except OSError:
+        pass
+
+
+def load_theme_entry(theme_key: str) -> Dict[str, Any]:
+    """
+    Load theme configuration from JSON file, along with its validation state.
+
+    Configs are validated once when first parsed and the result is cached
+    with them, so trusted bundled configs are not re-validated every run.
 
     Args:
         theme_key: Theme identifier (e.g., "modern", "corporate")
 
     Returns:
-        Theme configuration dictionary
+        {"config": theme configuration dictionary, "validated": bool}
 
     Raises:
         ValueError: If theme not found or config invalid
@@ -161,14 +383,49 @@ def load_theme_config(theme_key: str) -> Dict[str, Any]:
     if not config_file.exists():
         raise ValueError(f"Theme config file not found: {config_file}")
 
+    # Parsed configs are cached on disk, keyed by the JSON file's mtime and size
+    cache_dir = get_cache_dir()
+    cache_file = None
+    if cache_dir is not None:
+        st = config_file.stat()
+        cache_file = cache_dir / f"{theme_key}-{st.st_mtime_ns}-{st.st_size}.pkl"
+        cached = _read_cached_entry(cache_file)
+        if cached is not None:
+            return cached
+
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        config = _loads(config_file.read_bytes())
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in theme config {config_file}: {e}")
 
     # Transform JSON config to expected format
-    return transform_json_config(config)
+    transformed = transform_json_config(config)
+    try:
+        validated = validate_theme_config(transformed)
+    except ValueError:
+        # Leave it to the caller to re-validate and report the problem
+        validated = False
+
+    entry = {"config": transformed, "validated": validated}
+    if cache_file is not None:
+        _write_cached_entry(cache_file, theme_key, entry)
+    return entry
+
+
+def load_theme_config(theme_key: str) -> Dict[str, Any]:
+    """
+    Load theme configuration from JSON file.
+
+    Args:
+        theme_key: Theme identifier (e.g., "modern", "corporate")
+
+    Returns:
+        Theme configuration dictionary
+
+    Raises:
+        ValueError: If theme not found or config invalid
+    """
+    return load_theme_entry(theme_key)["config"]
 
 
 def transform_json_config(json_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -197,6 +454,92 @@ def transform_json_config(json_config: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Prebuilt by build_themes_bundle.py; holds every bundled theme entry in one file
+BUNDLE_FILENAME = "_bundle.pkl"
+
+
+def get_bundle_path() -> Path:
+    """Get the path to the prebuilt theme bundle."""
+    return get_config_dir() / BUNDLE_FILENAME
+
+
+def _source_stamp() -> Dict[str, Any]:
+    """(mtime_ns, size) of every theme config file, used to detect a stale bundle."""
+    config_dir = get_config_dir()
+    stamp = {}
+    for theme_key, filename in THEME_CONFIG_MAP.items():
+        st = (config_dir / filename).stat()
+        stamp[theme_key] = (st.st_mtime_ns, st.st_size)
+    return stamp
+
+
+def write_theme_bundle(bundle_path: Optional[Path] = None) -> Path:
+    """
+    Parse, transform and validate every theme, and pickle the results into one file.
+
+    Returns:
+        Path of the written bundle.
+
+    Raises:
+        ValueError: If a theme config is missing or invalid
+    """
+    bundle_path = bundle_path or get_bundle_path()
+    entries = {theme_key: load_theme_entry(theme_key) for theme_key in THEME_CONFIG_MAP}
+    for entry in entries.values():
+        if not entry["validated"]:
+            # load_theme_entry defers the error; re-validate so the build fails loudly
+            validate_theme_config(entry["config"])
+    bundle = {"stamp": _source_stamp(), "entries": entries}
+    _atomic_pickle(bundle_path, bundle)
+    return bundle_path
+
+
+@lru_cache(maxsize=1)
+def _load_bundle() -> Optional[Dict[str, Dict[str, Any]]]:
+    """Return the bundled theme entries, or None if the bundle is missing or stale."""
+    try:
+        with open(get_bundle_path(), 'rb') as f:
+            bundle = pickle.load(f)
+        if bundle["stamp"] != _source_stamp():
+            return None
+        return bundle["entries"]
+    except Exception:
+        # No bundle (or a broken one) just means loading each theme separately
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_theme_entry(theme_key: str) -> Dict[str, Any]:
+    """
+    Load a single theme entry (config + validation state) at most once.
+
+    Uses the prebuilt bundle when it is up to date with the JSON configs.
+
+    Raises:
+        ValueError: If theme not found or config invalid
+    """
+    bundle = _load_bundle()
+    if bundle is not None and theme_key in bundle:
+        return bundle[theme_key]
+    return load_theme_entry(theme_key)
+
+
+def get_theme(theme_key: str) -> Dict[str, Any]:
+    """
+    Load a single theme configuration, reading its JSON file at most once.
+
+    Args:
+        theme_key: Theme identifier (e.g., "modern", "corporate")
+
+    Returns:
+        Theme configuration dictionary
+
+    Raises:
+        ValueError: If theme not found or config invalid
+    """
+    return get_theme_entry(theme_key)["config"]
+
+
 def get_all_themes() -> Dict[str, Dict[str, Any]]:
     """
     Load all available themes.
@@ -207,46 +550,76 @@ def get_all_themes() -> Dict[str, Dict[str, Any]]:
     themes = {}
     for theme_key in THEME_CONFIG_MAP:
         try:
-            themes[theme_key] = load_theme_config(theme_key)
+            themes[theme_key] = get_theme(theme_key)
         except ValueError as e:
             print(f"Warning: Could not load theme '{theme_key}': {e}")
     return themes
 
 
-# Load themes at module level for backwards compatibility
-THEMES = get_all_themes()
+def __getattr__(name: str) -> Any:
+    """Keep `THEMES` importable for backwards compatibility, loaded on first access."""
+    if name == "THEMES":
+        return get_all_themes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def generate_theme_css(theme_config: Dict[str, Any], dark_mode: bool = False) -> str:
-    """Generate Tailwind CSS v4.0 @theme configuration."""
+# Read once per process, so every file generated in a run shows the same year;
+# local time, like datetime.now(), without building a datetime object
+_CURRENT_YEAR = time.localtime().tm_year
 
-    css = """@import "tailwindcss";
+
+@dataclass(frozen=True)
+class RenderCtx:
+    """Everything the output generators need, computed once per run."""
+
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "name", "description", "colors", "fonts", "radius",
+        "year", "dark_mode", "colors_json", "config_json",
+    )
+
+    name: str
+    description: str
+    colors: Dict[str, str]
+    fonts: Dict[str, str]
+    radius: Dict[str, str]
+    year: int
+    dark_mode: bool
+    colors_json: str
+    config_json: bytes
+
+    @classmethod
+    def from_config(cls, theme_config: Dict[str, Any], dark_mode: bool = False) -> "RenderCtx":
+        """Build the render context for a (transformed) theme config."""
+        return cls(
+            name=theme_config["name"],
+            description=theme_config["description"],
+            colors=theme_config["colors"],
+            fonts=theme_config["fonts"],
+            radius=theme_config["radius"],
+            year=_CURRENT_YEAR,
+            dark_mode=dark_mode,
+            colors_json=_dumps_indent(theme_config["colors"]),
+            config_json=_dumps_indent_bytes(theme_config),
+        )
+
+
+# Static CSS blocks shared by every theme
+_CSS_PRELUDE = """@import "tailwindcss";
 
 @theme {
   /* Colors (HSL format) */
 """
 
-    # Add colors
-    for color_name, color_value in theme_config["colors"].items():
-        css += f"  --color-{color_name}: {color_value};\n"
-
-    css += """
+_CSS_TYPOGRAPHY_HEADER = """
   /* Typography */
 """
 
-    # Add fonts
-    for font_type, font_value in theme_config["fonts"].items():
-        css += f"  --font-{font_type}: {font_value};\n"
-
-    css += """
+_CSS_RADIUS_HEADER = """
   /* Border Radius */
 """
 
-    # Add border radius
-    for size, value in theme_config["radius"].items():
-        css += f"  --radius-{size}: {value};\n"
-
-    css += """  --radius-full: 9999px;
+_CSS_SPACING_SHADOWS_BLOCK = """  --radius-full: 9999px;
 
   /* Spacing (based on 0.25rem = 4px) */
   --spacing-0: 0;
@@ -272,9 +645,7 @@ def generate_theme_css(theme_config: Dict[str, Any], dark_mode: bool = False) ->
 }
 """
 
-    # Add dark mode if requested
-    if dark_mode:
-        css += """
+_CSS_DARK_BLOCK = """
 /* Dark Mode */
 @media (prefers-color-scheme: dark) {
   @theme {
@@ -293,8 +664,7 @@ def generate_theme_css(theme_config: Dict[str, Any], dark_mode: bool = False) ->
 }
 """
 
-    # Add component utilities
-    css += """
+_CSS_COMPONENTS_BLOCK = """
 /* Component Utilities */
 @layer components {
   .btn {
@@ -319,19 +689,73 @@ def generate_theme_css(theme_config: Dict[str, Any], dark_mode: bool = False) ->
 }
 """
 
-    return css
 
+# (key, value) pairs in config order
+_Pairs = Tuple[Tuple[str, str], ...]
 
-def generate_html_template(theme_name: str) -> str:
-    """Generate sample HTML template using the theme."""
-    current_year = datetime.now().year
 
-    return f"""<!DOCTYPE html>
+# Everything after the last theme-dependent token, pre-joined for both modes
+_CSS_TAIL = _CSS_SPACING_SHADOWS_BLOCK + _CSS_COMPONENTS_BLOCK
+_CSS_TAIL_DARK = _CSS_SPACING_SHADOWS_BLOCK + _CSS_DARK_BLOCK + _CSS_COMPONENTS_BLOCK
+
+
+def _iter_css(colors: Iterable[Tuple[str, str]], fonts: Iterable[Tuple[str, str]],
+              radius: Iterable[Tuple[str, str]], dark_mode: bool) -> Iterator[str]:
+    yield _CSS_PRELUDE
+
+    # Add colors
+    for k, v in colors:
+        yield f"  --color-{k}: {v};\n"
+
+    yield _CSS_TYPOGRAPHY_HEADER
+
+    # Add fonts
+    for k, v in fonts:
+        yield f"  --font-{k}: {v};\n"
+
+    yield _CSS_RADIUS_HEADER
+
+    # Add border radius
+    for k, v in radius:
+        yield f"  --radius-{k}: {v};\n"
+
+    # Spacing/shadows, dark mode if requested, and component utilities
+    yield _CSS_TAIL_DARK if dark_mode else _CSS_TAIL
+
+
+@lru_cache(maxsize=32)
+def _css_cached(colors: _Pairs, fonts: _Pairs, radius: _Pairs, dark_mode: bool) -> str:
+    return "".join(_iter_css(colors, fonts, radius, dark_mode))
+
+
+def iter_theme_css(ctx: RenderCtx) -> Iterator[str]:
+    """Yield the Tailwind CSS v4.0 @theme configuration chunk by chunk."""
+    return _iter_css(ctx.colors.items(), ctx.fonts.items(), ctx.radius.items(), ctx.dark_mode)
+
+
+def generate_theme_css(ctx: RenderCtx) -> str:
+    """
+    Generate Tailwind CSS v4.0 @theme configuration.
+
+    Results are memoized on the theme's tokens, so regenerating the same
+    theme returns the cached stylesheet.
+    """
+    # Keep config order (not sorted): it is the order tokens appear in the CSS
+    return _css_cached(
+        tuple(ctx.colors.items()),
+        tuple(ctx.fonts.items()),
+        tuple(ctx.radius.items()),
+        ctx.dark_mode,
+    )
+
+
+# Sample page skeleton; placeholders: {name}, {description}, {year}
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{THEMES[theme_name]['name']} Theme</title>
+  <title>{name} Theme</title>
   <link rel="stylesheet" href="theme.css">
 </head>
 <body class="bg-background text-text">
@@ -360,10 +784,10 @@ def generate_html_template(theme_name: str) -> str:
   <section class="py-20 px-4 bg-background">
     <div class="max-w-4xl mx-auto text-center">
       <h1 class="text-5xl md:text-6xl lg:text-7xl font-display font-bold text-text mb-6 leading-tight">
-        Welcome to {THEMES[theme_name]['name']}
+        Welcome to {name}
       </h1>
       <p class="text-xl md:text-2xl text-text-muted mb-8 max-w-2xl mx-auto">
-        {THEMES[theme_name]['description']}
+        {description}
       </p>
       <div class="flex flex-col sm:flex-row gap-4 justify-center">
         <a href="#" class="btn-primary text-lg">Get Started</a>
@@ -396,20 +820,18 @@ def generate_html_template(theme_name: str) -> str:
   <!-- Footer -->
   <footer class="bg-surface border-t border-gray-200 py-8 px-4">
     <div class="max-w-7xl mx-auto text-center">
-      <p class="text-text-muted">&copy; {current_year} Your Company. All rights reserved.</p>
+      <p class="text-text-muted">&copy; {year} Your Company. All rights reserved.</p>
     </div>
   </footer>
 </body>
 </html>
 """
 
+# README skeleton; placeholders: {name}, {description}, {colors_json},
+# {display_font}, {text_font}
+_README_TEMPLATE = """# {name} Theme
 
-def generate_readme(theme_name: str) -> str:
-    """Generate README for the theme."""
-
-    return f"""# {THEMES[theme_name]['name']} Theme
-
-{THEMES[theme_name]['description']}
+{description}
 
 ## Installation
 
@@ -449,12 +871,12 @@ def generate_readme(theme_name: str) -> str:
 
 ## Color Palette
 
-{json.dumps(THEMES[theme_name]['colors'], indent=2)}
+{colors_json}
 
 ## Typography
 
-- Display Font: {THEMES[theme_name]['fonts']['display']}
-- Text Font: {THEMES[theme_name]['fonts']['text']}
+- Display Font: {display_font}
+- Text Font: {text_font}
 
 ## Customization
 
@@ -471,13 +893,161 @@ MIT License
 """
 
 
+def generate_html_template(ctx: RenderCtx) -> str:
+    """Generate sample HTML template using the theme."""
+    return _HTML_TEMPLATE.format(
+        name=ctx.name,
+        description=ctx.description,
+        year=ctx.year,
+    )
+
+
+def generate_readme(ctx: RenderCtx) -> str:
+    """Generate README for the theme."""
+    return _README_TEMPLATE.format(
+        name=ctx.name,
+        description=ctx.description,
+        colors_json=ctx.colors_json,
+        display_font=ctx.fonts['display'],
+        text_font=ctx.fonts['text'],
+    )
+
+
+def iter_render_all(ctx: RenderCtx) -> Dict[str, Iterable[Chunk]]:
+    """
+    Every output file for a theme, as filename -> chunks of content.
+
+    The CSS is streamed; the HTML and README are single format() templates
+    and come through as one chunk each; theme-config.json is already
+    encoded bytes.
+    """
+    return {
+        "theme.css": iter_theme_css(ctx),
+        "index.html": (generate_html_template(ctx),),
+        "README.md": (generate_readme(ctx),),
+        "theme-config.json": (ctx.config_json,),
+    }
+
+
+def render_all(ctx: RenderCtx) -> Dict[str, str]:
+    """Render every output file for a theme, as filename -> content."""
+    return {
+        name: b"".join(map(_as_bytes, chunks)).decode("utf-8")
+        for name, chunks in iter_render_all(ctx).items()
+    }
+
+
+@lru_cache(maxsize=None)
+def render_theme(theme_key: str, dark_mode: bool = False) -> Mapping[str, str]:
+    """
+    Render every output file for a bundled theme, at most once per (theme, dark_mode).
+
+    Returns a read-only filename -> content mapping, since it is shared
+    between callers.
+
+    Raises:
+        ValueError: If theme not found or config invalid
+    """
+    ctx = RenderCtx.from_config(get_theme(theme_key), dark_mode)
+    return MappingProxyType(render_all(ctx))
+
+
+# Files written for every theme, in the order they are reported
+OUTPUT_FILES = ("theme.css", "index.html", "README.md", "theme-config.json")
+
+# Pre-rendered outputs for every (theme, dark_mode), written by build_themes_bundle.py
+_PREBUILT_STAMP_FILE = "_stamp.pkl"
+
+
+def get_prebuilt_root() -> Path:
+    """Get the directory holding pre-rendered theme outputs."""
+    return get_config_dir().parent / "prebuilt-themes"
+
+
+def _prebuilt_name(theme_key: str, dark_mode: bool) -> str:
+    return f"{theme_key}-dark" if dark_mode else theme_key
+
+
+def _prebuilt_stamp() -> Dict[str, Any]:
+    """
+    Everything the pre-rendered files depend on: the JSON configs, this
+    generator's code, and the copyright year in index.html.
+    """
+    st = Path(__file__).stat()
+    return {
+        "configs": _source_stamp(),
+        "generator": (st.st_mtime_ns, st.st_size),
+        "year": _CURRENT_YEAR,
+    }
+
+
+def write_prebuilt_themes(root: Optional[Path] = None) -> Path:
+    """
+    Render every theme with and without dark mode into root/<theme>[-dark]/.
+
+    Returns:
+        The root directory written.
+
+    Raises:
+        ValueError: If a theme config is missing or invalid
+    """
+    root = root or get_prebuilt_root()
+    for theme_key in THEME_CONFIG_MAP:
+        for dark_mode in (False, True):
+            theme_dir = root / _prebuilt_name(theme_key, dark_mode)
+            theme_dir.mkdir(parents=True, exist_ok=True)
+            for filename, content in render_theme(theme_key, dark_mode).items():
+                _fast_write(theme_dir / filename, (content,))
+    # Stamp last: a partially written tree is never considered valid
+    with open(root / _PREBUILT_STAMP_FILE, 'wb') as f:
+        pickle.dump(_prebuilt_stamp(), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return root
+
+
+@lru_cache(maxsize=1)
+def _prebuilt_is_current() -> bool:
+    try:
+        with open(get_prebuilt_root() / _PREBUILT_STAMP_FILE, 'rb') as f:
+            return pickle.load(f) == _prebuilt_stamp()
+    except Exception:
+        # Missing or unreadable stamp: render at runtime instead
+        return False
+
+
+def get_prebuilt_dir(theme_key: str, dark_mode: bool = False) -> Optional[Path]:
+    """Return the pre-rendered output directory for a theme, or None if absent or stale."""
+    if not _prebuilt_is_current():
+        return None
+    theme_dir = get_prebuilt_root() / _prebuilt_name(theme_key, dark_mode)
+    if not all((theme_dir / filename).is_file() for filename in OUTPUT_FILES):
+        return None
+    return theme_dir
+
+
+def copy_output_files(source_dir: Path, output_dir: Path) -> Iterator[Path]:
+    """
+    Copy pre-rendered output files into output_dir.
+
+    Yields the written paths in OUTPUT_FILES order; raises OutputWriteError
+    on the first failure.
+    """
+    for filename in OUTPUT_FILES:
+        file_path = output_dir / filename
+        with _output_write_errors(file_path, filename):
+            shutil.copyfile(source_dir / filename, file_path)
+        yield file_path
+
+
 def main():
+    # Imported here so that importing this module (e.g. for THEMES) stays cheap
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Generate complete theme boilerplate with chosen aesthetic style"
     )
     parser.add_argument(
         "--theme",
-        choices=list(THEMES.keys()),
+        choices=tuple(THEME_CONFIG_MAP),
         help="Theme style to generate"
     )
     parser.add_argument(
@@ -500,13 +1070,18 @@ def main():
         action="store_true",
         help="Validate theme config without generating files"
     )
+    parser.add_argument(
+        "--regenerate",
+        action="store_true",
+        help="Render the theme now even if pre-rendered files are available"
+    )
 
     args = parser.parse_args()
 
     # List themes
     if args.list:
         print("\nAvailable Themes:\n")
-        for key, theme in THEMES.items():
+        for key, theme in get_all_themes().items():
             print(f"  {key:12} - {theme['name']}")
             print(f"               {theme['description']}\n")
         return
@@ -517,11 +1092,13 @@ def main():
         print("\n❌ Error: --theme is required (or use --list to see available themes)")
         sys.exit(1)
 
-    theme_config = THEMES[args.theme]
-
-    # Validate theme configuration
+    # Load theme configuration; configs already validated on first load
+    # are trusted, --validate-only always re-checks
     try:
-        validate_theme_config(theme_config)
+        theme_entry = get_theme_entry(args.theme)
+        theme_config = theme_entry["config"]
+        if args.validate_only or not theme_entry["validated"]:
+            validate_theme_config(theme_config)
         if args.validate_only:
             print(f"✅ Theme '{args.theme}' configuration is valid")
             return
@@ -532,7 +1109,11 @@ def main():
     output_dir = Path(args.output)
 
     # Create output directory with error handling
-    safe_create_directory(output_dir)
+    try:
+        safe_create_directory(output_dir)
+    except ThemeGenError as e:
+        _print_error(e)
+        sys.exit(1)
 
     print(f"\n🎨 Generating {theme_config['name']} theme...")
 
@@ -540,25 +1121,21 @@ def main():
     generated_files = []
 
     try:
-        # Generate theme.css
-        theme_css = generate_theme_css(theme_config, args.dark_mode)
-        safe_write_file(output_dir / "theme.css", theme_css, "theme.css")
-        generated_files.append(output_dir / "theme.css")
-
-        # Generate index.html
-        index_html = generate_html_template(args.theme)
-        safe_write_file(output_dir / "index.html", index_html, "index.html")
-        generated_files.append(output_dir / "index.html")
-
-        # Generate README.md
-        readme = generate_readme(args.theme)
-        safe_write_file(output_dir / "README.md", readme, "README.md")
-        generated_files.append(output_dir / "README.md")
-
-        # Generate theme-config.json
-        config_json = json.dumps(theme_config, indent=2)
-        safe_write_file(output_dir / "theme-config.json", config_json, "theme-config.json")
-        generated_files.append(output_dir / "theme-config.json")
+        prebuilt_dir = None if args.regenerate else get_prebuilt_dir(args.theme, args.dark_mode)
+        if prebuilt_dir is not None:
+            # Up-to-date pre-rendered files: just copy them
+            written = copy_output_files(prebuilt_dir, output_dir)
+        else:
+            # Render theme.css, index.html, README.md and theme-config.json
+            # from one shared context, streaming them out concurrently
+            ctx = RenderCtx.from_config(theme_config, args.dark_mode)
+            written = write_output_files([
+                (output_dir / filename, content, filename)
+                for filename, content in iter_render_all(ctx).items()
+            ])
+        for file_path in written:
+            print(f"✅ Created {file_path.name}")
+            generated_files.append(file_path)
 
         print(f"\n✨ Theme generated successfully in: {output_dir.absolute()}")
         print(f"\n📝 Next steps:")
@@ -566,6 +1143,11 @@ def main():
         print(f"   2. Customize colors in theme.css")
         print(f"   3. Build your pages using the component classes\n")
 
+    except ThemeGenError as e:
+        _print_error(e)
+        print(f"   Generated {len(generated_files)} files before failure.")
+        print(f"   You may need to clean up: {output_dir}")
+        sys.exit(1)
     except Exception as e:
         print(f"\n❌ Error during generation: {e}")
         print(f"   Generated {len(generated_files)} files before failure.")
@@ -1,8 +1,10 @@
 """
 Shared dependencies for API endpoints.
 """
-from typing import Annotated
-from fastapi import Depends, Query
+from typing import Annotated, Optional
+import asyncpg
+from fastapi import Depends, Query, Request
+from redis.asyncio import Redis
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.database import get_session
 from app.core.config import settings
@@ -12,6 +14,24 @@ from app.core.config import settings
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
+def get_pg_pool(request: Request) -> Optional[asyncpg.Pool]:
+    """Raw asyncpg pool created at startup, or None when the fast path is off."""
+    return getattr(request.app.state, "pg_pool", None)
+
+
+# Type alias for the optional asyncpg fast-path pool
+PgPoolDep = Annotated[Optional[asyncpg.Pool], Depends(get_pg_pool)]
+
+
+def get_redis(request: Request) -> Optional[Redis]:
+    """Redis cache client created at startup, or None when caching is off."""
+    return getattr(request.app.state, "redis", None)
+
+
+# Type alias for the optional Redis cache client
+RedisDep = Annotated[Optional[Redis], Depends(get_redis)]
+
+
 class CommonQueryParams:
     """
     Reusable pagination query parameters.
@@ -22,6 +42,9 @@ class CommonQueryParams:
             skip = commons.skip
             limit = commons.limit
     """
+    # Built for every paginated request; no per-instance __dict__ needed
+    __slots__ = ("skip", "limit")
+
     def __init__(
         self,
         skip: int = Query(default=settings.DEFAULT_SKIP, ge=0, description="Number of records to skip"),
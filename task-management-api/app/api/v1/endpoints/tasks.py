@@ -2,8 +2,10 @@
 Task API endpoints with full CRUD operations.
 """
 from typing import Optional
-from fastapi import APIRouter, HTTPException, status, Query
-from app.api.deps import SessionDep, PaginationDep
+from fastapi import APIRouter, HTTPException, status, Query, Response
+from app.api.deps import SessionDep, PaginationDep, PgPoolDep, RedisDep
+from app.core import cache
+from app.core.config import settings
 from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
 from app.models.task import TaskStatus, TaskPriority
 from app.crud import task as crud
@@ -22,7 +24,8 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 )
 async def create_task(
     task_in: TaskCreate,
-    session: SessionDep
+    session: SessionDep,
+    redis: RedisDep
 ) -> TaskResponse:
     """
     Create a new task.
@@ -30,11 +33,14 @@ async def create_task(
     Args:
         task_in: Task creation data
         session: Database session
+        redis: Redis cache client, if enabled
 
     Returns:
         Created task with generated ID and timestamps
     """
     task = await crud.create_task(session, task_in)
+    if redis is not None:
+        await cache.invalidate(redis)
     return task
 
 
@@ -47,8 +53,12 @@ async def create_task(
 async def get_tasks(
     session: SessionDep,
     pagination: PaginationDep,
+    pg_pool: PgPoolDep,
+    redis: RedisDep,
     status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
-    priority: Optional[TaskPriority] = Query(None, description="Filter by task priority")
+    priority: Optional[TaskPriority] = Query(None, description="Filter by task priority"),
+    include_description: bool = Query(True, description="Include task descriptions in the page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from a previous page; replaces skip")
 ) -> TaskListResponse:
     """
     Retrieve all tasks with optional filtering.
@@ -56,32 +66,62 @@ async def get_tasks(
     Args:
         session: Database session
         pagination: Pagination parameters (skip, limit)
+        pg_pool: Raw asyncpg pool for the fast path, if enabled
+        redis: Redis cache client, if enabled
         status: Optional status filter
         priority: Optional priority filter
+        include_description: Whether to read the description column
+        cursor: Keyset cursor from a previous page's next_cursor
 
     Returns:
         Paginated list of tasks with total count
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
     """
-    # Filter by status if provided
-    if status:
-        tasks, total = await crud.get_tasks_by_status(
-            session, status.value, pagination.skip, pagination.limit
-        )
-    # Filter by priority if provided
-    elif priority:
-        tasks, total = await crud.get_tasks_by_priority(
-            session, priority.value, pagination.skip, pagination.limit
+    try:
+        after = crud.decode_cursor(cursor) if cursor else None
+    except ValueError:
+        # `status` is the filter parameter here, not fastapi.status
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if redis is not None:
+        key = await cache.list_key(
+            redis, pagination.skip, pagination.limit, status, priority, include_description, cursor
         )
-    # No filter - get all tasks
+        cached = await redis.get(key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
+    # One query shape for every filter combination; both paths return plain rows
+    query = dict(
+        skip=pagination.skip,
+        limit=pagination.limit,
+        status=status.value if status else None,
+        priority=priority.value if priority else None,
+        include_description=include_description,
+        after=after,
+    )
+    if pg_pool is not None:
+        rows, total = await crud.get_tasks_fast(pg_pool, **query)
     else:
-        tasks, total = await crud.get_tasks(session, pagination.skip, pagination.limit)
+        rows, total = await crud.get_tasks(session, **query)
 
-    return TaskListResponse(
-        items=tasks,
+    # A full page may have more rows after it
+    next_cursor = None
+    if len(rows) == pagination.limit:
+        next_cursor = crud.encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+    response = TaskListResponse(
+        items=rows,
         total=total,
         skip=pagination.skip,
-        limit=pagination.limit
+        limit=pagination.limit,
+        next_cursor=next_cursor
     )
+    if redis is not None:
+        await redis.setex(key, settings.CACHE_TTL, response.model_dump_json())
+    return response
 
 
 @router.get(
@@ -92,7 +132,9 @@ async def get_tasks(
 )
 async def get_task(
     task_id: int,
-    session: SessionDep
+    session: SessionDep,
+    pg_pool: PgPoolDep,
+    redis: RedisDep
 ) -> TaskResponse:
     """
     Retrieve a single task by ID.
@@ -100,6 +142,8 @@ async def get_task(
     Args:
         task_id: Task ID to retrieve
         session: Database session
+        pg_pool: Raw asyncpg pool for the fast path, if enabled
+        redis: Redis cache client, if enabled
 
     Returns:
         Task data
@@ -107,10 +151,25 @@ async def get_task(
     Raises:
         HTTPException: 404 if task not found
     """
-    task = await crud.get_task(session, task_id)
-    if not task:
-        raise TaskNotFoundException(task_id)
-    return task
+    if redis is not None:
+        cached = await redis.get(cache.task_key(task_id))
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
+    if pg_pool is not None:
+        row = await crud.get_task_fast(pg_pool, task_id)
+        if not row:
+            raise TaskNotFoundException(task_id)
+        response = TaskResponse.model_validate(row)
+    else:
+        task = await crud.get_task(session, task_id)
+        if not task:
+            raise TaskNotFoundException(task_id)
+        response = TaskResponse.model_validate(task)
+
+    if redis is not None:
+        await redis.setex(cache.task_key(task_id), settings.CACHE_TTL, response.model_dump_json())
+    return response
 
 
 @router.put(
@@ -122,7 +181,8 @@ async def get_task(
 async def update_task(
     task_id: int,
     task_in: TaskUpdate,
-    session: SessionDep
+    session: SessionDep,
+    redis: RedisDep
 ) -> TaskResponse:
     """
     Update an existing task.
@@ -131,6 +191,7 @@ async def update_task(
         task_id: Task ID to update
         task_in: Task update data (only provided fields will be updated)
         session: Database session
+        redis: Redis cache client, if enabled
 
     Returns:
         Updated task data
@@ -141,6 +202,8 @@ async def update_task(
     task = await crud.update_task(session, task_id, task_in)
     if not task:
         raise TaskNotFoundException(task_id)
+    if redis is not None:
+        await cache.invalidate(redis, task_id)
     return task
 
 
@@ -153,7 +216,8 @@ async def update_task(
 async def patch_task(
     task_id: int,
     task_in: TaskUpdate,
-    session: SessionDep
+    session: SessionDep,
+    redis: RedisDep
 ) -> TaskResponse:
     """
     Partially update a task (same as PUT for this API).
@@ -162,6 +226,7 @@ async def patch_task(
         task_id: Task ID to update
         task_in: Task update data
         session: Database session
+        redis: Redis cache client, if enabled
 
     Returns:
         Updated task data
@@ -172,6 +237,8 @@ async def patch_task(
     task = await crud.update_task(session, task_id, task_in)
     if not task:
         raise TaskNotFoundException(task_id)
+    if redis is not None:
+        await cache.invalidate(redis, task_id)
     return task
 
 
@@ -183,7 +250,8 @@ async def patch_task(
 )
 async def delete_task(
     task_id: int,
-    session: SessionDep
+    session: SessionDep,
+    redis: RedisDep
 ) -> None:
     """
     Delete a task by ID.
@@ -191,6 +259,7 @@ async def delete_task(
     Args:
         task_id: Task ID to delete
         session: Database session
+        redis: Redis cache client, if enabled
 
     Returns:
         None (204 No Content)
@@ -201,3 +270,5 @@ async def delete_task(
     deleted = await crud.delete_task(session, task_id)
     if not deleted:
         raise TaskNotFoundException(task_id)
+    if redis is not None:
+        await cache.invalidate(redis, task_id)
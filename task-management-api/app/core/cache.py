@@ -0,0 +1,51 @@
+"""
+Redis read-through cache for hot task reads.
+
+Single tasks are cached under task:{id}. List pages embed a tasks:version
+counter in their key, so any write invalidates every cached page with one
+INCR instead of a key scan.
+"""
+from typing import Optional
+from redis.asyncio import Redis
+from app.core.config import settings
+
+
+VERSION_KEY = "tasks:version"
+
+
+def create_redis() -> Optional[Redis]:
+    """
+    Create the Redis client used for caching.
+
+    Returns:
+        The client, or None if REDIS_URL is not configured
+    """
+    if not settings.REDIS_URL:
+        return None
+    return Redis.from_url(settings.REDIS_URL)
+
+
+def task_key(task_id: int) -> str:
+    """Cache key for a single task."""
+    return f"task:{task_id}"
+
+
+async def list_key(redis: Redis, *params: object) -> str:
+    """Cache key for a list page, scoped to the current tasks version."""
+    version = await redis.get(VERSION_KEY) or b"0"
+    return f"tasks:list:{version.decode()}:" + ":".join(map(str, params))
+
+
+async def invalidate(redis: Redis, task_id: Optional[int] = None) -> None:
+    """
+    Drop cached reads after a write.
+
+    Args:
+        redis: Redis client
+        task_id: Task that changed, if an existing task was updated or deleted
+    """
+    async with redis.pipeline(transaction=False) as pipe:
+        if task_id is not None:
+            pipe.delete(task_key(task_id))
+        pipe.incr(VERSION_KEY)
+        await pipe.execute()
@@ -1,12 +1,14 @@
 """
 Database configuration and session management for SQLModel with async support.
 """
-from typing import AsyncGenerator
+from functools import cache
+from typing import AsyncGenerator, Optional
 import ssl
-from sqlmodel import SQLModel, create_engine
+import asyncpg
+from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
 
@@ -20,36 +22,77 @@ if "?" in database_url:
     base_url = database_url.split("?")[0]
     database_url = base_url
 
-# Convert to asyncpg format
-if database_url.startswith("postgresql://"):
-    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+# Convert to asyncpg format (postgres:// is the short scheme some providers hand out)
+for scheme in ("postgresql://", "postgres://"):
+    if database_url.startswith(scheme):
+        database_url = database_url.replace(scheme, "postgresql+asyncpg://", 1)
+        break
+
+# Raw asyncpg DSN for the read fast path (asyncpg has no "+asyncpg" dialect suffix)
+asyncpg_dsn = database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+@cache
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    SSL context for Neon PostgreSQL (Neon requires SSL connections).
+
+    Built once per process: loading the default cert store is not free,
+    and reloads or test fixtures may touch this module repeatedly.
+    """
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
 
-# Configure SSL for Neon PostgreSQL
-# Neon requires SSL connections
-ssl_context = ssl.create_default_context()
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
 
 # Create async engine with SSL configuration
 engine = create_async_engine(
     database_url,
-    echo=True,  # Set to False in production
+    echo=settings.ECHO_SQL,
     future=True,
+    poolclass=AsyncAdaptedQueuePool,  # asyncio-safe queue pool (plain QueuePool is not)
     pool_pre_ping=True,  # Verify connections before using
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     connect_args={
-        "ssl": ssl_context,  # SSL context for Neon
+        "ssl": get_ssl_context(),  # SSL context for Neon
         "server_settings": {
             "jit": "off"  # Recommended for Neon
         }
     }
 )
 
-# Async session factory
-async_session = sessionmaker(
+# Async session factory (class_ keeps SQLModel's AsyncSession and its exec())
+async_session = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
+async def create_pg_pool() -> Optional[asyncpg.Pool]:
+    """
+    Create the raw asyncpg pool used by hot read endpoints.
+
+    Queries are prepared on first use and kept in each connection's
+    statement cache, so repeated reads skip the parse step.
+
+    Returns:
+        The pool, or None if the fast path is disabled or the database
+        is not PostgreSQL.
+    """
+    if not settings.USE_ASYNCPG_FAST_PATH or not database_url.startswith("postgresql+asyncpg://"):
+        return None
+    return await asyncpg.create_pool(
+        asyncpg_dsn,
+        min_size=settings.PG_POOL_MIN_SIZE,
+        max_size=settings.PG_POOL_MAX_SIZE,
+        statement_cache_size=1024,
+        ssl=get_ssl_context(),
+        server_settings={"jit": "off"},
+    )
+
+
 async def init_db():
     """Create database tables. Call this on application startup."""
     async with engine.begin() as conn:
@@ -61,6 +104,9 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     Dependency for getting async database sessions.
     Automatically handles session lifecycle and cleanup.
 
+    Sessions are not committed here: write operations commit themselves
+    (see app.crud.task), so read-only requests skip an empty COMMIT.
+
     Usage:
         @app.get("/items")
         async def get_items(session: AsyncSession = Depends(get_session)):
@@ -69,7 +115,6 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
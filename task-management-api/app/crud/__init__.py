@@ -1,20 +1,22 @@
 """Task CRUD operations."""
 from app.crud.task import (
     create_task,
+    create_tasks,
     get_task,
+    get_task_fast,
     get_tasks,
-    get_tasks_by_status,
-    get_tasks_by_priority,
+    get_tasks_fast,
     update_task,
     delete_task
 )
 
 __all__ = [
     "create_task",
+    "create_tasks",
     "get_task",
+    "get_task_fast",
     "get_tasks",
-    "get_tasks_by_status",
-    "get_tasks_by_priority",
+    "get_tasks_fast",
     "update_task",
     "delete_task"
 ]
@@ -2,14 +2,46 @@
 CRUD operations for Task entity.
 Handles database operations with proper async/await patterns.
 """
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
+from functools import lru_cache
+import base64
+import asyncpg
+from sqlalchemy import DateTime, Integer, Select, bindparam, delete, func, insert, tuple_, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
-from app.models.task import Task
+from app.models.task import Task, TaskStatus, TaskPriority
 from app.schemas.task import TaskCreate, TaskUpdate
 
 
+# Columns read by the list queries; description (up to 2000 chars) is the
+# only wide column and can be left out
+_LIST_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.status,
+    Task.priority,
+    Task.created_at,
+    Task.updated_at,
+)
+
+
+def encode_cursor(created_at: datetime, task_id: int) -> str:
+    """Encode the (created_at, id) keyset position of a task as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{task_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, task_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    return datetime.fromisoformat(created_at), int(task_id)
+
+
 async def create_task(session: AsyncSession, task_in: TaskCreate) -> Task:
     """
     Create a new task in the database.
@@ -21,13 +53,38 @@ async def create_task(session: AsyncSession, task_in: TaskCreate) -> Task:
     Returns:
         Created task with generated id and timestamps
     """
-    task = Task(**task_in.model_dump())
-    session.add(task)
+    # INSERT ... RETURNING hands back the generated id and the database's
+    # timestamps without a refresh query. The full model_dump() sends TaskCreate's
+    # defaults explicitly; the model's Field defaults are also Column defaults,
+    # but the schema is the contract
+    statement = insert(Task).values(**task_in.model_dump()).returning(Task)
+    task = await session.scalar(statement)
     await session.commit()
-    await session.refresh(task)
     return task
 
 
+async def create_tasks(session: AsyncSession, tasks_in: list[TaskCreate]) -> list[Task]:
+    """
+    Create many tasks in one batched INSERT and a single commit.
+
+    Args:
+        session: Database session
+        tasks_in: Task creation schemas with validated data
+
+    Returns:
+        Created tasks with generated ids and timestamps, in input order
+    """
+    if not tasks_in:
+        return []
+
+    # Timestamps come from the database's NOW() default, as in create_task
+    rows = [task_in.model_dump() for task_in in tasks_in]
+    result = await session.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows)
+    tasks = list(result.all())
+    await session.commit()
+    return tasks
+
+
 async def get_task(session: AsyncSession, task_id: int) -> Optional[Task]:
     """
     Retrieve a single task by ID.
@@ -39,9 +96,61 @@ async def get_task(session: AsyncSession, task_id: int) -> Optional[Task]:
     Returns:
         Task if found, None otherwise
     """
-    statement = select(Task).where(Task.id == task_id)
-    result = await session.execute(statement)
-    return result.scalar_one_or_none()
+    # Primary-key lookup: served from the identity map when already loaded
+    return await session.get(Task, task_id)
+
+
+def _task_filters(has_status: bool, has_priority: bool) -> list:
+    """WHERE conditions for the optional get_tasks filters, with bound values."""
+    conditions = []
+    if has_status:
+        conditions.append(Task.status == bindparam("status"))
+    if has_priority:
+        conditions.append(Task.priority == bindparam("priority"))
+    return conditions
+
+
+@lru_cache(maxsize=None)
+def _list_statement(
+    include_description: bool,
+    has_status: bool,
+    has_priority: bool,
+    keyset: bool
+) -> Select:
+    """
+    Build the get_tasks page query for one parameter shape.
+
+    Filter and paging values are bound at execution time, so each of the
+    sixteen shapes is constructed once and reuses SQLAlchemy's compiled form.
+    """
+    conditions = _task_filters(has_status, has_priority)
+
+    columns = _LIST_COLUMNS + (Task.description,) if include_description else _LIST_COLUMNS
+    if not keyset:
+        # Offset page; the total number of matching rows comes back with the
+        # page via COUNT(*) OVER (), so a page is one round-trip
+        statement = (
+            select(*columns, func.count().over().label("total"))
+            .where(*conditions)
+            .offset(bindparam("skip", type_=Integer))
+        )
+    else:
+        # Keyset page: seek past the cursor row instead of scanning `skip` rows
+        after = tuple_(
+            bindparam("after_created_at", type_=DateTime), bindparam("after_id", type_=Integer)
+        )
+        statement = select(*columns).where(*conditions, tuple_(Task.created_at, Task.id) < after)
+    return (
+        statement
+        .limit(bindparam("limit", type_=Integer))
+        .order_by(Task.created_at.desc(), Task.id.desc())
+    )
+
+
+@lru_cache(maxsize=None)
+def _count_statement(has_status: bool, has_priority: bool) -> Select:
+    """Build the get_tasks total-count query for one filter shape."""
+    return select(func.count()).select_from(Task).where(*_task_filters(has_status, has_priority))
 
 
 async def get_tasks(
@@ -49,87 +158,55 @@ async def get_tasks(
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
-    priority: Optional[str] = None
-) -> tuple[list[Task], int]:
+    priority: Optional[str] = None,
+    include_description: bool = True,
+    after: Optional[tuple[datetime, int]] = None
+) -> tuple[list[Dict[str, Any]], int]:
     """
     Retrieve multiple tasks with pagination and optional filtering.
 
+    Selects an explicit column list and returns plain rows, skipping ORM
+    entity hydration for list pages.
+
     Args:
         session: Database session
-        skip: Number of records to skip (offset)
+        skip: Number of records to skip (offset); ignored when after is given
         limit: Maximum number of records to return
         status: Optional status filter
         priority: Optional priority filter
+        include_description: Whether to read the description column
+        after: Optional (created_at, id) keyset position to continue after
 
     Returns:
-        Tuple of (list of tasks, total count)
+        Tuple of (list of task fields, total count)
     """
-    # Build query with optional filters
-    statement = select(Task)
-
-    if status:
-        statement = statement.where(Task.status == status)
-    if priority:
-        statement = statement.where(Task.priority == priority)
-
-    # Apply pagination and ordering
-    statement = statement.offset(skip).limit(limit).order_by(Task.created_at.desc())
-    result = await session.execute(statement)
-    tasks = result.scalars().all()
-
-    # Get total count with same filters
-    count_statement = select(Task)
+    # Optional filters, shared by the page query and the count query
+    filters = {}
     if status:
-        count_statement = count_statement.where(Task.status == status)
+        filters["status"] = status
     if priority:
-        count_statement = count_statement.where(Task.priority == priority)
-
-    count_result = await session.execute(count_statement)
-    total = len(count_result.scalars().all())
-
-    return list(tasks), total
+        filters["priority"] = priority
 
+    params = {**filters, "limit": limit}
+    if after is None:
+        params["skip"] = skip
+    else:
+        params["after_created_at"], params["after_id"] = after
 
-async def get_tasks_by_status(
-    session: AsyncSession,
-    status: str,
-    skip: int = 0,
-    limit: int = 100
-) -> tuple[list[Task], int]:
-    """
-    Retrieve tasks filtered by status.
+    statement = _list_statement(include_description, bool(status), bool(priority), after is not None)
+    result = await session.execute(statement, params)
+    rows = result.mappings().all()
+    tasks = [{key: row[key] for key in row.keys() if key != "total"} for row in rows]
 
-    Args:
-        session: Database session
-        status: Task status to filter by
-        skip: Number of records to skip (offset)
-        limit: Maximum number of records to return
+    if after is None and rows:
+        total = rows[0]["total"]
+    elif after is None and skip == 0:
+        total = 0
+    else:
+        # Keyset pages and pages past the end carry no window total: count separately
+        total = await session.scalar(_count_statement(bool(status), bool(priority)), filters)
 
-    Returns:
-        Tuple of (list of tasks, total count)
-    """
-    return await get_tasks(session, skip=skip, limit=limit, status=status)
-
-
-async def get_tasks_by_priority(
-    session: AsyncSession,
-    priority: str,
-    skip: int = 0,
-    limit: int = 100
-) -> tuple[list[Task], int]:
-    """
-    Retrieve tasks filtered by priority.
-
-    Args:
-        session: Database session
-        priority: Task priority to filter by
-        skip: Number of records to skip (offset)
-        limit: Maximum number of records to return
-
-    Returns:
-        Tuple of (list of tasks, total count)
-    """
-    return await get_tasks(session, skip=skip, limit=limit, priority=priority)
+    return tasks, total
 
 
 async def update_task(
@@ -148,22 +225,21 @@ async def update_task(
     Returns:
         Updated task if found, None otherwise
     """
-    # Fetch existing task
-    task = await get_task(session, task_id)
+    # Update fields that are provided (not None), plus the timestamp (set here:
+    # neither PostgreSQL nor SQLite has ON UPDATE), and get the updated row
+    # back in the same round-trip
+    update_data = task_in.model_dump(exclude_unset=True)
+    statement = (
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**update_data, updated_at=datetime.utcnow())
+        .returning(Task)
+    )
+    task = await session.scalar(statement)
     if not task:
         return None
 
-    # Update fields that are provided (not None)
-    update_data = task_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
-    # Update timestamp
-    task.updated_at = datetime.utcnow()
-
-    session.add(task)
     await session.commit()
-    await session.refresh(task)
     return task
 
 
@@ -178,10 +254,98 @@ async def delete_task(session: AsyncSession, task_id: int) -> bool:
     Returns:
         True if task was deleted, False if not found
     """
-    task = await get_task(session, task_id)
-    if not task:
+    # DELETE ... RETURNING tells us whether the task existed in one round-trip
+    statement = delete(Task).where(Task.id == task_id).returning(Task.id)
+    if await session.scalar(statement) is None:
         return False
 
-    await session.delete(task)
     await session.commit()
     return True
+
+
+# Raw asyncpg fast path for hot reads: rows go straight to the response
+# schema without ORM hydration
+_TASK_COLUMNS = "id, title, description, status, priority, created_at, updated_at"
+_LIST_COLUMNS_SQL = "id, title, status, priority, created_at, updated_at"
+GET_TASK_SQL = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = $1"
+
+
+def _task_row(record: asyncpg.Record) -> Dict[str, Any]:
+    """Convert an asyncpg record into TaskResponse fields."""
+    row = dict(record)
+    row.pop("total", None)
+    # SQLAlchemy stores enum member names (e.g. IN_PROGRESS), not values
+    row["status"] = TaskStatus[row["status"]]
+    row["priority"] = TaskPriority[row["priority"]]
+    return row
+
+
+async def get_task_fast(pool: asyncpg.Pool, task_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve a single task by ID through the raw asyncpg pool.
+
+    Args:
+        pool: asyncpg connection pool
+        task_id: Task ID to retrieve
+
+    Returns:
+        Task fields if found, None otherwise
+    """
+    async with pool.acquire() as conn:
+        record = await conn.fetchrow(GET_TASK_SQL, task_id)
+    return _task_row(record) if record else None
+
+
+async def get_tasks_fast(
+    pool: asyncpg.Pool,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    include_description: bool = True,
+    after: Optional[tuple[datetime, int]] = None
+) -> tuple[list[Dict[str, Any]], int]:
+    """
+    Retrieve multiple tasks through the raw asyncpg pool.
+
+    Same filtering, ordering and counting as get_tasks.
+
+    Returns:
+        Tuple of (list of task fields, total count)
+    """
+    conditions = []
+    args: list[Any] = []
+    if status:
+        args.append(TaskStatus(status).name)
+        conditions.append(f"status = ${len(args)}")
+    if priority:
+        args.append(TaskPriority(priority).name)
+        conditions.append(f"priority = ${len(args)}")
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    filter_args = tuple(args)
+
+    columns = _TASK_COLUMNS if include_description else _LIST_COLUMNS_SQL
+    if after is None:
+        args += [limit, skip]
+        statement = (
+            f"SELECT {columns}, COUNT(*) OVER () AS total FROM tasks{where}"
+            f" ORDER BY created_at DESC, id DESC LIMIT ${len(args) - 1} OFFSET ${len(args)}"
+        )
+    else:
+        args += [*after, limit]
+        keyset = f"(created_at, id) < (${len(args) - 2}, ${len(args) - 1})"
+        statement = (
+            f"SELECT {columns} FROM tasks{where + ' AND ' if where else ' WHERE '}{keyset}"
+            f" ORDER BY created_at DESC, id DESC LIMIT ${len(args)}"
+        )
+    async with pool.acquire() as conn:
+        records = await conn.fetch(statement, *args)
+        if after is None and records:
+            total = records[0]["total"]
+        elif after is None and skip == 0:
+            total = 0
+        else:
+            # Keyset pages and pages past the end carry no window total: count separately
+            total = await conn.fetchval(f"SELECT COUNT(*) FROM tasks{where}", *filter_args)
+
+    return [_task_row(record) for record in records], total
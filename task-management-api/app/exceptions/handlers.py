@@ -2,11 +2,39 @@
 Custom exception classes and handlers for the API.
 Provides consistent error responses across the application.
 """
-from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from typing import Optional
+import orjson
+from fastapi import HTTPException, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 
 
+def _skeleton(**fields: str) -> bytes:
+    """Serialize the static leading fields of an error body, left open for more."""
+    return orjson.dumps(fields)[:-1]
+
+
+# Static parts of the error bodies, serialized once at import
+_NOT_FOUND = _skeleton(error="Not Found")
+_DATABASE_ERROR = _skeleton(error="Database Error")
+_INTERNAL_ERROR = _skeleton(error="Internal Server Error", message="An unexpected error occurred")
+
+
+def _error_response(
+    status_code: int,
+    skeleton: bytes,
+    path: str,
+    message: Optional[str] = None
+) -> Response:
+    """Complete a precomputed error skeleton with the per-request fields."""
+    body = skeleton
+    if message is not None:
+        body += b',"message":' + orjson.dumps(message)
+    body += b',"path":' + orjson.dumps(path) + b"}"
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
 class TaskNotFoundException(HTTPException):
     """Exception raised when a task is not found."""
     def __init__(self, task_id: int):
@@ -25,21 +53,13 @@ class DatabaseException(HTTPException):
         )
 
 
-async def task_not_found_handler(request: Request, exc: TaskNotFoundException) -> JSONResponse:
+async def task_not_found_handler(request: Request, exc: TaskNotFoundException) -> Response:
     """Handler for TaskNotFoundException."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": "Not Found",
-            "message": exc.detail,
-            "path": str(request.url.path)
-        }
-    )
+    return _error_response(exc.status_code, _NOT_FOUND, request.url.path, exc.detail)
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handler for request validation errors."""
-    # Convert error details to JSON-serializable format
     errors = []
     for error in exc.errors():
         error_dict = {
@@ -47,51 +67,39 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "msg": error.get("msg"),
             "type": error.get("type"),
         }
-        # Handle ctx field which may contain non-serializable objects
+        # ctx values are stringified (e.g. {"max_length": "200"}), which also
+        # covers the ValueError a field_validator raised
         if "ctx" in error:
             ctx = error["ctx"]
             if isinstance(ctx, dict):
                 error_dict["ctx"] = {k: str(v) for k, v in ctx.items()}
             else:
                 error_dict["ctx"] = str(ctx)
-        # Handle input field
         if "input" in error:
-            try:
-                error_dict["input"] = error["input"]
-            except (TypeError, ValueError):
-                error_dict["input"] = str(error["input"])
+            error_dict["input"] = error["input"]
         errors.append(error_dict)
 
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": "Validation Error",
-            "message": "Invalid request data",
-            "details": errors,
-            "path": str(request.url.path)
-        }
-    )
+    content = {
+        "error": "Validation Error",
+        "message": "Invalid request data",
+        "details": errors,
+        "path": str(request.url.path)
+    }
+    try:
+        return ORJSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content=content)
+    except TypeError:
+        # input that orjson can't encode, e.g. raw bytes
+        content["details"] = jsonable_encoder(
+            errors, custom_encoder={bytes: lambda b: b.decode("utf-8", "replace")}
+        )
+        return ORJSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content=content)
 
 
-async def database_exception_handler(request: Request, exc: DatabaseException) -> JSONResponse:
+async def database_exception_handler(request: Request, exc: DatabaseException) -> Response:
     """Handler for database exceptions."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": "Database Error",
-            "message": exc.detail,
-            "path": str(request.url.path)
-        }
-    )
+    return _error_response(exc.status_code, _DATABASE_ERROR, request.url.path, exc.detail)
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handler for uncaught exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "Internal Server Error",
-            "message": "An unexpected error occurred",
-            "path": str(request.url.path)
-        }
-    )
+    return _error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, _INTERNAL_ERROR, request.url.path)
@@ -4,11 +4,13 @@ Main entry point for the Task Management API.
 """
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.cache import create_redis
+from app.core.database import create_pg_pool, init_db
 from app.api.v1.api import api_router
 from app.exceptions.handlers import (
     TaskNotFoundException,
@@ -30,11 +32,17 @@ async def lifespan(app: FastAPI):
     print("🚀 Starting up Task Management API...")
     await init_db()
     print("✅ Database tables created/verified")
+    app.state.pg_pool = await create_pg_pool()
+    app.state.redis = create_redis()
 
     yield
 
     # Shutdown: Cleanup if needed
     print("👋 Shutting down Task Management API...")
+    if app.state.pg_pool is not None:
+        await app.state.pg_pool.close()
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
 
 
 # Initialize FastAPI application
@@ -52,6 +60,7 @@ app = FastAPI(
     - Automatic API documentation
     """,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson: much faster list serialization
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json"
@@ -103,10 +112,13 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    # Production entrypoint; use `uvicorn app.main:app --reload` for development
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        loop="uvloop",
+        http="httptools",
+        workers=settings.WORKERS
     )
@@ -4,6 +4,7 @@ SQLModel for Task entity with database table definition.
 from datetime import datetime
 from typing import Optional
 from enum import Enum
+from sqlalchemy import Column, DateTime, Index, func, text
 from sqlmodel import Field, SQLModel
 
 
@@ -29,14 +30,34 @@ class Task(SQLModel, table=True):
     priority levels, and automatic timestamps.
     """
     __tablename__ = "tasks"
+    # Indexes matching get_tasks: filter on status and/or priority, newest
+    # first, with id as the keyset tie-breaker
+    __table_args__ = (
+        Index(
+            "ix_tasks_status_priority_created_at",
+            "status", "priority", text("created_at DESC"), text("id DESC"),
+        ),
+        # Status-only filters can't use the composite above for ordering:
+        # priority sits between status and created_at
+        Index("ix_tasks_status_created_at", "status", text("created_at DESC"), text("id DESC")),
+        Index("ix_tasks_priority_created_at", "priority", text("created_at DESC"), text("id DESC")),
+        Index("ix_tasks_created_at_desc", text("created_at DESC"), text("id DESC")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(index=True, min_length=1, max_length=200)
     description: Optional[str] = Field(default=None, max_length=2000)
     status: TaskStatus = Field(default=TaskStatus.PENDING)
     priority: TaskPriority = Field(default=TaskPriority.MEDIUM)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Set by the database's NOW() on INSERT; None on a Task not yet inserted.
+    # sa_column keeps the Column free of a Python-side default, which SQLModel
+    # would otherwise copy from the field and send in every INSERT
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
 
     class Config:
         """Pydantic model configuration."""
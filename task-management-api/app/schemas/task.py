@@ -91,6 +91,7 @@ class TaskListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there may be one")
 
     class Config:
         json_schema_extra = {
@@ -108,6 +109,7 @@ class TaskListResponse(BaseModel):
                 ],
                 "total": 1,
                 "skip": 0,
-                "limit": 100
+                "limit": 100,
+                "next_cursor": None
             }
         }
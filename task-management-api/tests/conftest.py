@@ -5,24 +5,48 @@ Provides database sessions, FastAPI test client, and test data.
 import pytest
 import pytest_asyncio
 from typing import AsyncGenerator
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.main import app
 from app.core.database import get_session
+from app.crud.task import create_tasks
 from app.models.task import Task
+from app.schemas.task import TaskCreate, TaskResponse
 
 
-# Test database URL (using SQLite for fast testing)
+# Test database URL (using SQLite for fast testing). In-memory, so every
+# pytest-xdist worker process gets its own private database
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
-@pytest_asyncio.fixture(scope="function")
+def pytest_addoption(parser):
+    """Register --run-slow; slow tests are skipped without it."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Run every async test in the session-wide event loop the shared fixtures
+    live in, and skip slow tests unless --run-slow is given.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    skip_slow = pytest.mark.skip(reason="slow test: use --run-slow to run")
+    run_slow = config.getoption("--run-slow")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if not run_slow and "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest_asyncio.fixture(scope="session")
 async def test_engine():
-    """Create test database engine."""
+    """Create the test database engine and tables once per test session."""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
@@ -35,30 +59,42 @@ async def test_engine():
 
     yield engine
 
-    # Drop all tables after test
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
-
     await engine.dispose()
 
 
+@pytest.fixture(scope="session")
+def test_session_maker(test_engine) -> async_sessionmaker[AsyncSession]:
+    """Session factory bound to the shared test engine."""
+    return async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
 @pytest_asyncio.fixture(scope="function")
-async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
+async def test_session(test_engine, test_session_maker) -> AsyncGenerator[AsyncSession, None]:
     """
-    Provide database session for tests with automatic rollback.
-    Each test gets a fresh session and database state.
+    Provide database session for tests with automatic cleanup.
+    Each test gets a fresh session; rows it committed are deleted afterwards,
+    since CRUD functions commit and a rollback alone would not undo them.
     """
-    async_session_maker = sessionmaker(
-        test_engine, class_=AsyncSession, expire_on_commit=False
-    )
-
-    async with async_session_maker() as session:
+    async with test_session_maker() as session:
         yield session
         await session.rollback()
 
+    async with test_engine.begin() as conn:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """One async HTTP client over the ASGI app, shared by the whole session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
 
 @pytest_asyncio.fixture(scope="function")
-async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def client(
+    http_client: AsyncClient, test_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
     """
     Provide async HTTP client for FastAPI testing.
     Overrides database dependency to use test session.
@@ -69,8 +105,7 @@ async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None
 
     app.dependency_overrides[get_session] = override_get_session
 
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+    yield http_client
 
     # Clean up dependency override
     app.dependency_overrides.clear()
@@ -109,8 +144,11 @@ async def created_task(client: AsyncClient, sample_task_data: dict):
 
 
 @pytest_asyncio.fixture
-async def multiple_tasks(client: AsyncClient):
-    """Create multiple tasks for pagination and filtering tests."""
+async def multiple_tasks(client: AsyncClient, test_session: AsyncSession):
+    """
+    Create multiple tasks for pagination and filtering tests.
+    Seeded with one batched INSERT rather than a POST per task.
+    """
     tasks_data = [
         {"title": "Task 1", "description": "First task", "status": "pending", "priority": "low"},
         {"title": "Task 2", "description": "Second task", "status": "in_progress", "priority": "medium"},
@@ -119,10 +157,6 @@ async def multiple_tasks(client: AsyncClient):
         {"title": "Task 5", "description": "Fifth task", "status": "in_progress", "priority": "low"},
     ]
 
-    created_tasks = []
-    for task_data in tasks_data:
-        response = await client.post("/api/v1/tasks/", json=task_data)
-        assert response.status_code == 201
-        created_tasks.append(response.json())
-
-    return created_tasks
+    tasks = await create_tasks(test_session, [TaskCreate(**task_data) for task_data in tasks_data])
+    # Same shape as the API's JSON responses
+    return [TaskResponse.model_validate(task).model_dump(mode="json") for task in tasks]
@@ -0,0 +1,244 @@
+"""
+Integration tests for the Redis read cache on the task endpoints.
+Tests cache misses and hits, raw cached responses, and invalidation on writes.
+"""
+from typing import Dict, List, Optional
+import orjson
+import pytest
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.main import app
+from app.api.deps import get_redis
+from app.core.cache import VERSION_KEY, task_key
+from app.crud.task import create_task
+from app.schemas.task import TaskCreate
+
+
+class FakePipeline:
+    """In-memory stand-in for a non-transactional redis.asyncio pipeline."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: List[tuple] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.commands.clear()
+
+    def delete(self, *keys: str) -> None:
+        self.commands.append((self.redis.delete, keys))
+
+    def incr(self, key: str) -> None:
+        self.commands.append((self.redis.incr, (key,)))
+
+    async def execute(self) -> list:
+        return [await command(*args) for command, args in self.commands]
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis; values come back as bytes."""
+
+    def __init__(self):
+        self.store: Dict[str, bytes] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.store.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value.encode() if isinstance(value, str) else value
+
+    async def incr(self, key: str) -> int:
+        value = int(self.store.get(key, b"0")) + 1
+        self.store[key] = str(value).encode()
+        return value
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def list_keys(self) -> List[str]:
+        return [key for key in self.store if key.startswith("tasks:list:")]
+
+
+@pytest.fixture
+def fake_redis(client: AsyncClient) -> FakeRedis:
+    """Serve RedisDep from an in-memory fake; the client fixture clears the override."""
+    redis = FakeRedis()
+    app.dependency_overrides[get_redis] = lambda: redis
+    return redis
+
+
+class TestTaskCacheReads:
+    """Test suite for cached task reads."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_get_task_miss_populates_cache(
+        self, client: AsyncClient, fake_redis: FakeRedis, created_task: dict
+    ):
+        """
+        Test that a cache miss reads the database and stores the task.
+
+        GIVEN an existing task that is not cached
+        WHEN GET request for the task
+        THEN the task is returned and cached under task:{id}
+        """
+        # Arrange
+        task_id = created_task["id"]
+        assert task_key(task_id) not in fake_redis.store
+
+        # Act
+        response = await client.get(f"/api/v1/tasks/{task_id}")
+
+        # Assert
+        assert response.status_code == 200
+        assert orjson.loads(fake_redis.store[task_key(task_id)]) == response.json()
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_get_task_hit_returns_cached_bytes(
+        self, client: AsyncClient, fake_redis: FakeRedis, created_task: dict
+    ):
+        """
+        Test that a cache hit returns the stored JSON without touching the database.
+
+        GIVEN a cached entry that differs from the database row
+        WHEN GET request for the task
+        THEN the cached bytes are returned unchanged as JSON
+        """
+        # Arrange
+        task_id = created_task["id"]
+        cached = orjson.dumps({**created_task, "title": "From cache"})
+        fake_redis.store[task_key(task_id)] = cached
+
+        # Act
+        response = await client.get(f"/api/v1/tasks/{task_id}")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == cached
+        assert response.json()["title"] == "From cache"
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_list_hit_skips_database(
+        self,
+        client: AsyncClient,
+        fake_redis: FakeRedis,
+        multiple_tasks: list,
+        test_session: AsyncSession,
+    ):
+        """
+        Test that a repeated list request is served from the cache.
+
+        GIVEN a cached list page
+        WHEN a row is inserted without going through the API and the page is requested again
+        THEN the cached page is returned unchanged
+        """
+        # Arrange
+        first = await client.get("/api/v1/tasks/?limit=10")
+        assert first.status_code == 200
+        assert len(fake_redis.list_keys()) == 1
+        await create_task(test_session, TaskCreate(title="Written behind the cache"))
+
+        # Act
+        second = await client.get("/api/v1/tasks/?limit=10")
+
+        # Assert
+        assert second.status_code == 200
+        assert second.content == fake_redis.store[fake_redis.list_keys()[0]]
+        assert second.json() == first.json()
+        assert second.json()["total"] == len(multiple_tasks)
+
+
+class TestTaskCacheInvalidation:
+    """Test suite for cache invalidation on writes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_create_invalidates_list_pages(
+        self, client: AsyncClient, fake_redis: FakeRedis, multiple_tasks: list
+    ):
+        """
+        Test that creating a task invalidates cached list pages.
+
+        GIVEN a cached list page
+        WHEN a task is created through the API
+        THEN the next list request reads the database and includes the new task
+        """
+        # Arrange
+        await client.get("/api/v1/tasks/")
+
+        # Act
+        created = await client.post("/api/v1/tasks/", json={"title": "New Task"})
+        response = await client.get("/api/v1/tasks/")
+
+        # Assert
+        assert created.status_code == 201
+        assert fake_redis.store[VERSION_KEY] == b"1"
+        assert response.json()["total"] == len(multiple_tasks) + 1
+        assert created.json()["id"] in [item["id"] for item in response.json()["items"]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_update_invalidates_task_and_list_pages(
+        self, client: AsyncClient, fake_redis: FakeRedis, created_task: dict
+    ):
+        """
+        Test that updating a task drops its cached entry and cached list pages.
+
+        GIVEN a cached task and a cached list page
+        WHEN the task is updated through PUT and PATCH
+        THEN both reads return the updated task
+        """
+        # Arrange
+        task_id = created_task["id"]
+        await client.get(f"/api/v1/tasks/{task_id}")
+        await client.get("/api/v1/tasks/")
+
+        for method, title in (("put", "Updated by PUT"), ("patch", "Updated by PATCH")):
+            # Act
+            updated = await client.request(
+                method.upper(), f"/api/v1/tasks/{task_id}", json={"title": title}
+            )
+            task = await client.get(f"/api/v1/tasks/{task_id}")
+            tasks = await client.get("/api/v1/tasks/")
+
+            # Assert
+            assert updated.status_code == 200
+            assert task.json()["title"] == title
+            assert tasks.json()["items"][0]["title"] == title
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_delete_invalidates_task_and_list_pages(
+        self, client: AsyncClient, fake_redis: FakeRedis, created_task: dict
+    ):
+        """
+        Test that deleting a task drops its cached entry and cached list pages.
+
+        GIVEN a cached task and a cached list page
+        WHEN the task is deleted
+        THEN the task returns 404 and the list is empty
+        """
+        # Arrange
+        task_id = created_task["id"]
+        await client.get(f"/api/v1/tasks/{task_id}")
+        await client.get("/api/v1/tasks/")
+
+        # Act
+        deleted = await client.delete(f"/api/v1/tasks/{task_id}")
+        task = await client.get(f"/api/v1/tasks/{task_id}")
+        tasks = await client.get("/api/v1/tasks/")
+
+        # Assert
+        assert deleted.status_code == 204
+        assert task_key(task_id) not in fake_redis.store
+        assert task.status_code == 404
+        assert tasks.json()["total"] == 0
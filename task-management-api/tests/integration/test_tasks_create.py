@@ -67,7 +67,7 @@ class TestTaskCreation:
         ("  Task with spaces  ", "Task with spaces"),  # Tests trimming
         ("Task with special chars !@#$%", "Task with special chars !@#$%"),
         ("Task with Unicode 你好🚀", "Task with Unicode 你好🚀"),
-        ("A" * 200, "A" * 200),  # Max length (200 chars)
+        pytest.param("A" * 200, "A" * 200, marks=pytest.mark.slow),  # Max length (200 chars)
     ])
     async def test_create_task_title_variations(
         self, client: AsyncClient, title: str, expected_title: str
@@ -91,48 +91,35 @@ class TestTaskCreation:
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    @pytest.mark.parametrize("status", ["pending", "in_progress", "completed"])
-    async def test_create_task_all_valid_statuses(self, client: AsyncClient, status: str):
+    @pytest.mark.slow
+    async def test_create_task_all_valid_statuses_and_priorities(self, client: AsyncClient):
         """
-        Test task creation with all valid status values.
+        Test task creation with every valid status and priority combination.
         
-        GIVEN all possible valid status values
-        WHEN tasks are created with each status
-        THEN tasks are created successfully
+        GIVEN all possible valid status and priority values
+        WHEN a task is created for each combination
+        THEN every task is created with the requested values
         """
         # Arrange
-        task_data = {"title": f"Task with {status} status", "status": status}
-
-        # Act
-        response = await client.post("/api/v1/tasks/", json=task_data)
-
-        # Assert
-        assert response.status_code == 201
-        assert response.json()["status"] == status
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    @pytest.mark.parametrize("priority", ["low", "medium", "high"])
-    async def test_create_task_all_valid_priorities(self, client: AsyncClient, priority: str):
-        """
-        Test task creation with all valid priority values.
-        
-        GIVEN all possible valid priority values
-        WHEN tasks are created with each priority
-        THEN tasks are created successfully
-        """
-        # Arrange
-        task_data = {"title": f"Task with {priority} priority", "priority": priority}
-
-        # Act
-        response = await client.post("/api/v1/tasks/", json=task_data)
-
-        # Assert
-        assert response.status_code == 201
-        assert response.json()["priority"] == priority
+        cases = [
+            {"title": f"Task with {status} status and {priority} priority",
+             "status": status, "priority": priority}
+            for status in ("pending", "in_progress", "completed")
+            for priority in ("low", "medium", "high")
+        ]
+
+        for task_data in cases:
+            # Act
+            response = await client.post("/api/v1/tasks/", json=task_data)
+
+            # Assert
+            assert response.status_code == 201, task_data
+            assert response.json()["status"] == task_data["status"]
+            assert response.json()["priority"] == task_data["priority"]
 
     @pytest.mark.asyncio
     @pytest.mark.integration
+    @pytest.mark.slow
     async def test_create_task_with_long_description(self, client: AsyncClient):
         """
         Test task creation with maximum allowed description length.
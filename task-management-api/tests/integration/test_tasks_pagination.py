@@ -0,0 +1,96 @@
+"""
+Integration tests for keyset cursor pagination (GET /api/v1/tasks/?cursor=...).
+Tests walking next_cursor to the end, the final empty page, and malformed cursors.
+"""
+import base64
+import pytest
+from httpx import AsyncClient
+
+
+class TestTaskCursorPagination:
+    """Test suite for paging through tasks with next_cursor."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_cursor_walk_visits_every_task_once(self, client: AsyncClient, multiple_tasks: list):
+        """
+        Test following next_cursor until it runs out.
+
+        GIVEN 5 tasks and a page size of 2
+        WHEN each page's next_cursor is followed
+        THEN every task is returned exactly once, newest first, and the walk stops
+        """
+        # Arrange
+        params = {"limit": 2}
+        pages = []
+
+        # Act
+        while True:
+            response = await client.get("/api/v1/tasks/", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            pages.append(page)
+            if page["next_cursor"] is None:
+                break
+            assert len(pages) <= len(multiple_tasks)  # Guard against a cursor loop
+            params = {"limit": 2, "cursor": page["next_cursor"]}
+
+        # Assert
+        ids = [item["id"] for page in pages for item in page["items"]]
+        assert [len(page["items"]) for page in pages] == [2, 2, 1]
+        assert sorted(ids) == sorted(task["id"] for task in multiple_tasks)
+        assert ids == sorted(ids, reverse=True)  # Same created_at, so id breaks the tie
+        assert all(page["total"] == len(multiple_tasks) for page in pages)
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_cursor_exact_multiple_ends_with_empty_page(
+        self, client: AsyncClient, multiple_tasks: list
+    ):
+        """
+        Test the extra page when the row count is a multiple of the page size.
+
+        GIVEN 5 tasks and a page size of 5
+        WHEN the first page's next_cursor is followed
+        THEN one empty page with no next_cursor ends the walk
+        """
+        # Arrange
+        first = (await client.get("/api/v1/tasks/", params={"limit": 5})).json()
+
+        # Act
+        response = await client.get(
+            "/api/v1/tasks/", params={"limit": 5, "cursor": first["next_cursor"]}
+        )
+
+        # Assert
+        # A full page can't tell whether more rows follow, so it always hands out a cursor
+        assert len(first["items"]) == 5
+        assert first["next_cursor"] is not None
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"] == []
+        assert data["next_cursor"] is None
+        assert data["total"] == len(multiple_tasks)
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        base64.urlsafe_b64encode(b"no separator").decode(),
+        base64.urlsafe_b64encode(b"yesterday|1").decode(),
+        base64.urlsafe_b64encode(b"2024-01-10T10:30:00|one").decode(),
+    ])
+    async def test_malformed_cursor_returns_400(self, client: AsyncClient, cursor: str):
+        """
+        Test that a cursor not produced by the API is rejected.
+
+        GIVEN a malformed cursor
+        WHEN GET request is made with it
+        THEN 400 Bad Request is returned
+        """
+        # Act
+        response = await client.get("/api/v1/tasks/", params={"cursor": cursor})
+
+        # Assert
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
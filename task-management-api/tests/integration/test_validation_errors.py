@@ -400,6 +400,50 @@ class TestErrorResponseFormat:
             assert "loc" in data["details"][0]
             assert "msg" in data["details"][0]
 
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_422_error_detail_shape(self, client: AsyncClient):
+        """
+        Test the shape of each validation error detail.
+
+        GIVEN a title over the maximum length
+        WHEN POST request is made
+        THEN the detail carries loc, msg, type, input and a stringified ctx
+        """
+        # Arrange
+        task_data = {"title": "A" * 201}
+
+        # Act
+        response = await client.post("/api/v1/tasks/", json=task_data)
+
+        # Assert
+        assert response.status_code == 422
+        detail = response.json()["details"][0]
+        assert set(detail) == {"loc", "msg", "type", "ctx", "input"}
+        assert detail["loc"] == ["body", "title"]
+        assert detail["type"] == "string_too_long"
+        assert detail["ctx"] == {"max_length": "200"}
+        assert detail["input"] == task_data["title"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_422_error_validator_ctx_is_stringified(self, client: AsyncClient):
+        """
+        Test that a field validator's exception is reported as its message.
+
+        GIVEN a whitespace-only title
+        WHEN POST request is made
+        THEN the detail ctx holds the validator's error message as a string
+        """
+        # Act
+        response = await client.post("/api/v1/tasks/", json={"title": "   "})
+
+        # Assert
+        assert response.status_code == 422
+        detail = response.json()["details"][0]
+        assert detail["type"] == "value_error"
+        assert detail["ctx"] == {"error": "Title cannot be empty or whitespace"}
+
 
 class TestConcurrency:
     """Test suite for concurrent operations."""
@@ -4,13 +4,20 @@ Tests each CRUD function in isolation with mocked database sessions.
 """
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud.task import (
     create_task,
+    create_tasks,
     get_task,
+    get_task_fast,
     get_tasks,
+    get_tasks_fast,
+    GET_TASK_SQL,
+    encode_cursor,
+    decode_cursor,
     update_task,
     delete_task
 )
@@ -34,10 +41,9 @@ class TestCreateTask:
             priority=TaskPriority.HIGH
         )
 
-        # Mock the session methods
-        mock_session.add = MagicMock()
+        # Mock INSERT ... RETURNING
+        mock_session.scalar = AsyncMock(return_value=Task(id=1, **task_data.model_dump()))
         mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act
         result = await create_task(mock_session, task_data)
@@ -47,9 +53,35 @@ class TestCreateTask:
         assert result.description == "Test Description"
         assert result.status == TaskStatus.PENDING
         assert result.priority == TaskPriority.HIGH
-        mock_session.add.assert_called_once()
+        params = mock_session.scalar.call_args.args[0].compile().params
+        assert params["title"] == "Test Task"
+        mock_session.scalar.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        mock_session.refresh.assert_not_called()  # RETURNING replaces the refresh
+
+    @pytest.mark.asyncio
+    async def test_create_task_leaves_timestamps_to_database(self):
+        """Test that the compiled INSERT omits the timestamps so NOW() fills them."""
+        # Arrange
+        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session.scalar = AsyncMock(return_value=Task(id=1, title="Timestamps"))
+        mock_session.commit = AsyncMock()
+
+        # Act
+        await create_task(mock_session, TaskCreate(title="Timestamps"))
+
+        # Assert
+        # Compiling adds every column with a Python-side default to the INSERT,
+        # so this also fails if the model grows one again
+        compiled = mock_session.scalar.call_args.args[0].compile(dialect=postgresql.dialect())
+        inserted = str(compiled).split(" VALUES ")[0]
+        assert set(compiled.params) == {"title", "description", "status", "priority"}
+        assert "created_at" not in inserted
+        assert "updated_at" not in inserted
+        assert "RETURNING" in str(compiled)
+        assert Task.__table__.c.created_at.server_default is not None
+        assert Task.__table__.c.created_at.default is None
+        assert Task.__table__.c.updated_at.default is None
 
     @pytest.mark.asyncio
     async def test_create_task_minimal_data(self):
@@ -58,9 +90,8 @@ class TestCreateTask:
         mock_session = AsyncMock(spec=AsyncSession)
         task_data = TaskCreate(title="Minimal Task")
 
-        mock_session.add = MagicMock()
+        mock_session.scalar = AsyncMock(return_value=Task(id=1, **task_data.model_dump()))
         mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act
         result = await create_task(mock_session, task_data)
@@ -78,9 +109,8 @@ class TestCreateTask:
         mock_session = AsyncMock(spec=AsyncSession)
         task_data = TaskCreate(title="Task with defaults")
 
-        mock_session.add = MagicMock()
+        mock_session.scalar = AsyncMock(return_value=Task(id=1, **task_data.model_dump()))
         mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act
         result = await create_task(mock_session, task_data)
@@ -89,6 +119,53 @@ class TestCreateTask:
         assert result.status == TaskStatus.PENDING
         assert result.priority == TaskPriority.MEDIUM
         assert result.description is None
+        params = mock_session.scalar.call_args.args[0].compile().params
+        assert params["status"] == TaskStatus.PENDING
+        assert params["priority"] == TaskPriority.MEDIUM
+
+
+@pytest.mark.unit
+class TestCreateTasks:
+    """Test create_tasks batch CRUD operation."""
+
+    @pytest.mark.asyncio
+    async def test_create_tasks_single_batch(self):
+        """Test that many tasks are inserted in one statement and one commit."""
+        # Arrange
+        mock_session = AsyncMock(spec=AsyncSession)
+        tasks_data = [TaskCreate(title=f"Task {i}") for i in range(3)]
+
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            Task(id=i + 1, **task_data.model_dump()) for i, task_data in enumerate(tasks_data)
+        ]
+        mock_session.scalars = AsyncMock(return_value=mock_result)
+        mock_session.commit = AsyncMock()
+
+        # Act
+        result = await create_tasks(mock_session, tasks_data)
+
+        # Assert
+        assert [task.title for task in result] == ["Task 0", "Task 1", "Task 2"]
+        mock_session.scalars.assert_called_once()
+        rows = mock_session.scalars.call_args.args[1]
+        assert [row["title"] for row in rows] == ["Task 0", "Task 1", "Task 2"]
+        assert all("created_at" not in row and "updated_at" not in row for row in rows)
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_tasks_empty_list(self):
+        """Test that an empty batch does not touch the database."""
+        # Arrange
+        mock_session = AsyncMock(spec=AsyncSession)
+
+        # Act
+        result = await create_tasks(mock_session, [])
+
+        # Assert
+        assert result == []
+        mock_session.scalars.assert_not_called()
+        mock_session.commit.assert_not_called()
 
 
 @pytest.mark.unit
@@ -109,10 +186,8 @@ class TestGetTask:
             priority=TaskPriority.MEDIUM
         )
 
-        # Mock the execute result
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = expected_task
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        # Mock the primary-key lookup
+        mock_session.get = AsyncMock(return_value=expected_task)
 
         # Act
         result = await get_task(mock_session, task_id)
@@ -121,7 +196,7 @@ class TestGetTask:
         assert result is not None
         assert result.id == task_id
         assert result.title == "Found Task"
-        mock_session.execute.assert_called_once()
+        mock_session.get.assert_called_once_with(Task, task_id)
 
     @pytest.mark.asyncio
     async def test_get_task_not_found(self):
@@ -130,16 +205,14 @@ class TestGetTask:
         mock_session = AsyncMock(spec=AsyncSession)
         task_id = 999
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.get = AsyncMock(return_value=None)
 
         # Act
         result = await get_task(mock_session, task_id)
 
         # Assert
         assert result is None
-        mock_session.execute.assert_called_once()
+        mock_session.get.assert_called_once_with(Task, task_id)
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize("task_id", [0, -1, 1, 100, 999999])
@@ -147,15 +220,13 @@ class TestGetTask:
         """Test get_task with various valid and edge case IDs."""
         # Arrange
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.get = AsyncMock(return_value=None)
 
         # Act
         result = await get_task(mock_session, task_id)
 
         # Assert
-        mock_session.execute.assert_called_once()
+        mock_session.get.assert_called_once_with(Task, task_id)
         assert result is None  # All return None since we mock no task found
 
 
@@ -169,9 +240,9 @@ class TestGetTasks:
         # Arrange
         mock_session = AsyncMock(spec=AsyncSession)
 
-        # Mock empty result for both queries
+        # Mock empty page result
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.mappings.return_value.all.return_value = []
         mock_session.execute = AsyncMock(return_value=mock_result)
 
         # Act
@@ -180,7 +251,7 @@ class TestGetTasks:
         # Assert
         assert tasks == []
         assert total == 0
-        assert mock_session.execute.call_count == 2  # Called twice: pagination + count
+        assert mock_session.execute.call_count == 1  # Empty first page: no count query
 
     @pytest.mark.asyncio
     async def test_get_tasks_with_results(self):
@@ -188,15 +259,17 @@ class TestGetTasks:
         # Arrange
         mock_session = AsyncMock(spec=AsyncSession)
 
-        task1 = Task(id=1, title="Task 1", status=TaskStatus.PENDING, priority=TaskPriority.LOW)
-        task2 = Task(id=2, title="Task 2", status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH)
-        task3 = Task(id=3, title="Task 3", status=TaskStatus.COMPLETED, priority=TaskPriority.MEDIUM)
+        row1 = {"id": 1, "title": "Task 1", "status": TaskStatus.PENDING, "priority": TaskPriority.LOW}
+        row2 = {"id": 2, "title": "Task 2", "status": TaskStatus.IN_PROGRESS, "priority": TaskPriority.HIGH}
+        row3 = {"id": 3, "title": "Task 3", "status": TaskStatus.COMPLETED, "priority": TaskPriority.MEDIUM}
 
-        mock_tasks = [task1, task2, task3]
+        mock_rows = [row1, row2, row3]
 
-        # Mock pagination result
+        # Mock pagination result: column rows plus total from the windowed query
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_tasks
+        mock_result.mappings.return_value.all.return_value = [
+            {**row, "total": len(mock_rows)} for row in mock_rows
+        ]
         mock_session.execute = AsyncMock(return_value=mock_result)
 
         # Act
@@ -205,9 +278,10 @@ class TestGetTasks:
         # Assert
         assert len(tasks) == 3
         assert total == 3
-        assert tasks[0].title == "Task 1"
-        assert tasks[1].title == "Task 2"
-        assert tasks[2].title == "Task 3"
+        assert tasks[0]["title"] == "Task 1"
+        assert tasks[1]["title"] == "Task 2"
+        assert tasks[2]["title"] == "Task 3"
+        assert "total" not in tasks[0]
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize("skip,limit", [
@@ -221,8 +295,9 @@ class TestGetTasks:
         # Arrange
         mock_session = AsyncMock(spec=AsyncSession)
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.mappings.return_value.all.return_value = []
         mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.scalar = AsyncMock(return_value=0)  # Count query past the last page
 
         # Act
         tasks, total = await get_tasks(mock_session, skip=skip, limit=limit)
@@ -232,6 +307,195 @@ class TestGetTasks:
         assert total == 0
         mock_session.execute.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_get_tasks_keyset_page(self):
+        """Test that a cursor seeks past the last row instead of using OFFSET."""
+        # Arrange
+        mock_session = AsyncMock(spec=AsyncSession)
+        mock_result = MagicMock()
+        mock_result.mappings.return_value.all.return_value = [
+            {"id": 4, "title": "Task 4", "status": TaskStatus.PENDING, "priority": TaskPriority.LOW}
+        ]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.scalar = AsyncMock(return_value=5)  # Total over all matching tasks
+
+        # Act
+        tasks, total = await get_tasks(mock_session, limit=2, after=(datetime(2024, 1, 1), 5))
+
+        # Assert
+        assert [task["id"] for task in tasks] == [4]
+        assert total == 5
+        sql = str(mock_session.execute.call_args.args[0])
+        assert "OFFSET" not in sql
+        assert "(tasks.created_at, tasks.id) <" in sql
+
+
+@pytest.mark.unit
+class TestCursor:
+    """Test keyset cursor encoding."""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the position it encodes."""
+        position = (datetime(2024, 1, 10, 10, 30, 0, 123456), 42)
+        assert decode_cursor(encode_cursor(*position)) == position
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", "MjAyNHxhYmM="])
+    def test_decode_cursor_invalid(self, cursor):
+        """Test that malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+def _mock_pool(conn: MagicMock) -> MagicMock:
+    """asyncpg pool whose acquire() context yields the given connection."""
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = conn
+    return pool
+
+
+def _record(task_id: int, **fields) -> dict:
+    """Row as asyncpg returns it: enum columns hold SQLAlchemy's member names."""
+    return {
+        "id": task_id,
+        "title": f"Task {task_id}",
+        "status": "PENDING",
+        "priority": "MEDIUM",
+        "created_at": datetime(2024, 1, 1, 10, 0, 0),
+        "updated_at": datetime(2024, 1, 1, 10, 0, 0),
+        **fields,
+    }
+
+
+@pytest.mark.unit
+class TestGetTaskFast:
+    """Test get_task_fast asyncpg read path."""
+
+    @pytest.mark.asyncio
+    async def test_get_task_fast_found(self):
+        """Test that a record is mapped back to enum members."""
+        # Arrange
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(return_value=_record(1, status="IN_PROGRESS", priority="HIGH"))
+
+        # Act
+        result = await get_task_fast(_mock_pool(conn), 1)
+
+        # Assert
+        conn.fetchrow.assert_called_once_with(GET_TASK_SQL, 1)
+        assert GET_TASK_SQL.endswith("FROM tasks WHERE id = $1")
+        assert result["id"] == 1
+        assert result["status"] is TaskStatus.IN_PROGRESS
+        assert result["priority"] is TaskPriority.HIGH
+
+    @pytest.mark.asyncio
+    async def test_get_task_fast_not_found(self):
+        """Test that a missing task returns None."""
+        # Arrange
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(return_value=None)
+
+        # Act
+        result = await get_task_fast(_mock_pool(conn), 999)
+
+        # Assert
+        assert result is None
+
+
+@pytest.mark.unit
+class TestGetTasksFast:
+    """Test get_tasks_fast asyncpg read path."""
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_fast_offset_page_with_filters(self):
+        """Test the offset query, its $n placeholders and the window total."""
+        # Arrange
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[
+            _record(2, status="PENDING", priority="HIGH", total=7),
+            _record(1, status="PENDING", priority="HIGH", total=7),
+        ])
+        conn.fetchval = AsyncMock()
+
+        # Act
+        tasks, total = await get_tasks_fast(
+            _mock_pool(conn), skip=0, limit=10, status="pending", priority="high",
+            include_description=False,
+        )
+
+        # Assert
+        conn.fetch.assert_called_once_with(
+            "SELECT id, title, status, priority, created_at, updated_at,"
+            " COUNT(*) OVER () AS total FROM tasks WHERE status = $1 AND priority = $2"
+            " ORDER BY created_at DESC, id DESC LIMIT $3 OFFSET $4",
+            "PENDING", "HIGH", 10, 0,
+        )
+        conn.fetchval.assert_not_called()
+        assert total == 7
+        assert [task["id"] for task in tasks] == [2, 1]
+        assert "total" not in tasks[0]
+        assert tasks[0]["priority"] is TaskPriority.HIGH
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_fast_past_last_page_counts_separately(self):
+        """Test that an empty page past the end still reports the total."""
+        # Arrange
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[])
+        conn.fetchval = AsyncMock(return_value=3)
+
+        # Act
+        tasks, total = await get_tasks_fast(_mock_pool(conn), skip=10, limit=10)
+
+        # Assert
+        assert tasks == []
+        assert total == 3
+        conn.fetchval.assert_called_once_with("SELECT COUNT(*) FROM tasks")
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_fast_keyset_page_with_filter(self):
+        """Test the keyset query placeholders follow the filter arguments."""
+        # Arrange
+        after = (datetime(2024, 1, 1, 10, 0, 0), 5)
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[_record(4)])
+        conn.fetchval = AsyncMock(return_value=5)
+
+        # Act
+        tasks, total = await get_tasks_fast(
+            _mock_pool(conn), limit=2, status="pending", after=after
+        )
+
+        # Assert
+        conn.fetch.assert_called_once_with(
+            "SELECT id, title, description, status, priority, created_at, updated_at"
+            " FROM tasks WHERE status = $1 AND (created_at, id) < ($2, $3)"
+            " ORDER BY created_at DESC, id DESC LIMIT $4",
+            "PENDING", after[0], 5, 2,
+        )
+        conn.fetchval.assert_called_once_with(
+            "SELECT COUNT(*) FROM tasks WHERE status = $1", "PENDING"
+        )
+        assert [task["id"] for task in tasks] == [4]
+        assert total == 5
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_fast_keyset_page_without_filter(self):
+        """Test the keyset condition opens the WHERE clause when unfiltered."""
+        # Arrange
+        after = (datetime(2024, 1, 1, 10, 0, 0), 5)
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[])
+        conn.fetchval = AsyncMock(return_value=0)
+
+        # Act
+        await get_tasks_fast(_mock_pool(conn), limit=2, after=after)
+
+        # Assert
+        statement, *args = conn.fetch.call_args.args
+        assert " FROM tasks WHERE (created_at, id) < ($1, $2) ORDER BY" in statement
+        assert statement.endswith("LIMIT $3")
+        assert args == [after[0], 5, 2]
+
 
 @pytest.mark.unit
 class TestUpdateTask:
@@ -244,14 +508,14 @@ class TestUpdateTask:
         mock_session = AsyncMock(spec=AsyncSession)
         task_id = 1
 
-        existing_task = Task(
+        updated_task = Task(
             id=task_id,
-            title="Original Title",
+            title="Updated Title",
             description="Original Description",
-            status=TaskStatus.PENDING,
-            priority=TaskPriority.LOW,
+            status=TaskStatus.IN_PROGRESS,
+            priority=TaskPriority.HIGH,
             created_at=datetime(2024, 1, 1, 10, 0, 0),
-            updated_at=datetime(2024, 1, 1, 10, 0, 0)
+            updated_at=datetime(2024, 1, 2, 10, 0, 0)
         )
 
         update_data = TaskUpdate(
@@ -260,22 +524,22 @@ class TestUpdateTask:
             priority=TaskPriority.HIGH
         )
 
-        # Mock get_task to return existing task
-        with patch('app.crud.task.get_task', return_value=existing_task):
-            mock_session.add = MagicMock()
-            mock_session.commit = AsyncMock()
-            mock_session.refresh = AsyncMock()
+        # Mock UPDATE ... RETURNING result
+        mock_session.scalar = AsyncMock(return_value=updated_task)
+        mock_session.commit = AsyncMock()
 
-            # Act
-            result = await update_task(mock_session, task_id, update_data)
+        # Act
+        result = await update_task(mock_session, task_id, update_data)
 
-            # Assert
-            assert result is not None
-            assert result.title == "Updated Title"
-            assert result.status == TaskStatus.IN_PROGRESS
-            assert result.priority == TaskPriority.HIGH
-            assert result.description == "Original Description"  # Unchanged
-            mock_session.commit.assert_called_once()
+        # Assert
+        assert result is updated_task
+        params = mock_session.scalar.call_args.args[0].compile().params
+        assert params["title"] == "Updated Title"
+        assert params["status"] == TaskStatus.IN_PROGRESS
+        assert params["priority"] == TaskPriority.HIGH
+        assert "description" not in params  # Unchanged
+        mock_session.scalar.assert_called_once()  # Single round-trip
+        mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_update_task_not_found(self):
@@ -285,13 +549,16 @@ class TestUpdateTask:
         task_id = 999
         update_data = TaskUpdate(title="Updated Title")
 
-        # Mock get_task to return None
-        with patch('app.crud.task.get_task', return_value=None):
-            # Act
-            result = await update_task(mock_session, task_id, update_data)
+        # Mock UPDATE ... RETURNING matching no rows
+        mock_session.scalar = AsyncMock(return_value=None)
+        mock_session.commit = AsyncMock()
+
+        # Act
+        result = await update_task(mock_session, task_id, update_data)
 
-            # Assert
-            assert result is None
+        # Assert
+        assert result is None
+        mock_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_task_partial_update(self):
@@ -300,30 +567,30 @@ class TestUpdateTask:
         mock_session = AsyncMock(spec=AsyncSession)
         task_id = 1
 
-        existing_task = Task(
+        updated_task = Task(
             id=task_id,
             title="Original Title",
             description="Original Description",
-            status=TaskStatus.PENDING,
+            status=TaskStatus.COMPLETED,
             priority=TaskPriority.MEDIUM
         )
 
         # Update only status
         update_data = TaskUpdate(status=TaskStatus.COMPLETED)
 
-        with patch('app.crud.task.get_task', return_value=existing_task):
-            mock_session.add = MagicMock()
-            mock_session.commit = AsyncMock()
-            mock_session.refresh = AsyncMock()
+        mock_session.scalar = AsyncMock(return_value=updated_task)
+        mock_session.commit = AsyncMock()
 
-            # Act
-            result = await update_task(mock_session, task_id, update_data)
+        # Act
+        result = await update_task(mock_session, task_id, update_data)
 
-            # Assert
-            assert result.status == TaskStatus.COMPLETED
-            assert result.title == "Original Title"  # Unchanged
-            assert result.description == "Original Description"  # Unchanged
-            assert result.priority == TaskPriority.MEDIUM  # Unchanged
+        # Assert
+        assert result.status == TaskStatus.COMPLETED
+        params = mock_session.scalar.call_args.args[0].compile().params
+        assert params["status"] == TaskStatus.COMPLETED
+        assert "title" not in params  # Unchanged
+        assert "description" not in params  # Unchanged
+        assert "priority" not in params  # Unchanged
 
     @pytest.mark.asyncio
     async def test_update_task_updates_timestamp(self):
@@ -333,27 +600,24 @@ class TestUpdateTask:
         task_id = 1
 
         old_timestamp = datetime(2024, 1, 1, 10, 0, 0)
-        existing_task = Task(
+        update_data = TaskUpdate(title="Updated Title")
+
+        updated_task = Task(
             id=task_id,
-            title="Original Title",
+            title="Updated Title",
             status=TaskStatus.PENDING,
             priority=TaskPriority.MEDIUM,
-            created_at=old_timestamp,
-            updated_at=old_timestamp
+            created_at=old_timestamp
         )
+        mock_session.scalar = AsyncMock(return_value=updated_task)
+        mock_session.commit = AsyncMock()
 
-        update_data = TaskUpdate(title="Updated Title")
-
-        with patch('app.crud.task.get_task', return_value=existing_task):
-            mock_session.add = MagicMock()
-            mock_session.commit = AsyncMock()
-            mock_session.refresh = AsyncMock()
-
-            # Act
-            result = await update_task(mock_session, task_id, update_data)
+        # Act
+        await update_task(mock_session, task_id, update_data)
 
-            # Assert
-            assert result.updated_at > old_timestamp
+        # Assert
+        params = mock_session.scalar.call_args.args[0].compile().params
+        assert params["updated_at"] > old_timestamp
 
 
 @pytest.mark.unit
@@ -367,24 +631,17 @@ class TestDeleteTask:
         mock_session = AsyncMock(spec=AsyncSession)
         task_id = 1
 
-        existing_task = Task(
-            id=task_id,
-            title="Task to Delete",
-            status=TaskStatus.PENDING,
-            priority=TaskPriority.MEDIUM
-        )
-
-        with patch('app.crud.task.get_task', return_value=existing_task):
-            mock_session.delete = AsyncMock()
-            mock_session.commit = AsyncMock()
+        # Mock DELETE ... RETURNING id
+        mock_session.scalar = AsyncMock(return_value=task_id)
+        mock_session.commit = AsyncMock()
 
-            # Act
-            result = await delete_task(mock_session, task_id)
+        # Act
+        result = await delete_task(mock_session, task_id)
 
-            # Assert
-            assert result is True
-            mock_session.delete.assert_called_once_with(existing_task)
-            mock_session.commit.assert_called_once()
+        # Assert
+        assert result is True
+        mock_session.scalar.assert_called_once()  # Single round-trip
+        mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_delete_task_not_found(self):
@@ -393,12 +650,15 @@ class TestDeleteTask:
         mock_session = AsyncMock(spec=AsyncSession)
         task_id = 999
 
-        with patch('app.crud.task.get_task', return_value=None):
-            # Act
-            result = await delete_task(mock_session, task_id)
+        mock_session.scalar = AsyncMock(return_value=None)
+        mock_session.commit = AsyncMock()
+
+        # Act
+        result = await delete_task(mock_session, task_id)
 
-            # Assert
-            assert result is False
+        # Assert
+        assert result is False
+        mock_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize("task_id", [1, 100, 999])
@@ -407,20 +667,13 @@ class TestDeleteTask:
         # Arrange
         mock_session = AsyncMock(spec=AsyncSession)
 
-        existing_task = Task(
-            id=task_id,
-            title=f"Task {task_id}",
-            status=TaskStatus.PENDING,
-            priority=TaskPriority.MEDIUM
-        )
-
-        with patch('app.crud.task.get_task', return_value=existing_task):
-            mock_session.delete = AsyncMock()
-            mock_session.commit = AsyncMock()
+        mock_session.scalar = AsyncMock(return_value=task_id)
+        mock_session.commit = AsyncMock()
 
-            # Act
-            result = await delete_task(mock_session, task_id)
+        # Act
+        result = await delete_task(mock_session, task_id)
 
-            # Assert
-            assert result is True
-            mock_session.delete.assert_called_once()
+        # Assert
+        assert result is True
+        params = mock_session.scalar.call_args.args[0].compile().params
+        assert task_id in params.values()